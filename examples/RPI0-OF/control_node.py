@@ -1,29 +1,217 @@
 import os
+import math
+import struct
 import time
 import numpy as np
 
-from filterpy.kalman import KalmanFilter
-from filterpy.common import Q_discrete_white_noise
+try:
+    from numba import njit
+except ImportError: # no JIT on this platform, plain numpy is still correct
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        def wrapper(func):
+            return func
+        return wrapper
 
 from pid import PID
 
+DEG2RAD = 0.017453292519943295  # math.pi/180, hoisted out of the loop
+
+# Constant tuning parameters, hoisted to module scope: LOAD_GLOBAL on a
+# constant is cheaper than a LOAD_ATTR dict probe in the hot loop.
+PERIOD = 1/200                # Sleeping time
+ABS_MAX_VALUE_ROLL = 250      # PID Roll limit
+ABS_MAX_VALUE_PITCH = 250     # PID Pitch limit
+ABS_MAX_VALUE_THROTTLE = 300  # PID Throttle limit
+
+TAKEOFF_ALTITUDE = 0.7#m      # Take off altitude
+DEFAULT_TAKEOFF_THRUST = 360 #12.35V ->360  # 11.6V -> 400 #11.31 -> 410 # weight -> 340 # 420 is too much for takeoff
+
+'''ToF sensor offset'''
+# CogniFly offset -> z: -40mm, y: +38mm
+# TOFOFFSET_Z = 0.04 #m
+# TOFOFFSET_Y = 0.038 #m
+TOFOFFSET_Z = -0.02 #m
+TOFOFFSET_Y = -0.045 #m
+TOFOFFSET_R = np.sqrt(TOFOFFSET_Z**2 + TOFOFFSET_Y**2)
+TOFOFFSET_ANGLE = np.tan(TOFOFFSET_Z/TOFOFFSET_Y)
+
+'''PID gains'''
+#Pitch PID Gain
+PX_GAIN = 90
+IX_GAIN = 0.
+DX_GAIN = 103
+#Roll PID Gain
+PY_GAIN = 90
+IY_GAIN = 0.
+DY_GAIN = 103
+#Altitude PID Gain
+# For 2S battery
+PZ_GAIN = 60
+IZ_GAIN = 0.19
+DZ_GAIN = 35
+
+# Fixed-size binary pipe payloads (no pickling):
+# IMU: accX..accZ, gyroX..gyroZ, roll, pitch, yaw, battery voltage, timestamp
+IMU_STRUCT = struct.Struct('<11d')
+# CMDS: throttle, roll, pitch -- fixed slots, indexed by the constants below
+# (a plain list write is an index op; the old dict form hashed a string key
+# three times per tick)
+THR, ROL, PIT = 0, 1, 2
+CMDS_STRUCT = struct.Struct('<3d')
+
+@njit(cache=True)
+def kf_predict(x, P, F, B, Q, u):
+    '''Kalman predict step on plain ndarrays (x and P are returned, not mutated)'''
+    return F @ x + B * u, F @ P @ F.T + Q
+
+@njit(cache=True)
+def kf_update(x, P, H, R, z):
+    '''Kalman update step on plain ndarrays (x and P are returned, not mutated)
+
+    Both filters measure 2 values (dim_z == 2), so S is always 2x2 and the
+    closed-form inverse avoids the LAPACK call np.linalg.inv would make.
+    '''
+    y = z - H @ x
+    S = H @ P @ H.T + R
+    det = S[0,0]*S[1,1] - S[0,1]*S[1,0]
+    Sinv = np.empty((2, 2))
+    Sinv[0,0] =  S[1,1] / det
+    Sinv[0,1] = -S[0,1] / det
+    Sinv[1,0] = -S[1,0] / det
+    Sinv[1,1] =  S[0,0] / det
+    K = P @ H.T @ Sinv
+    x = x + K @ y
+    I = np.eye(P.shape[0])
+    P = (I - K @ H) @ P
+    return x, P
+
+@njit(cache=True)
+def kfxy_predict(x, P, dt, Q):
+    '''KFXY predict specialized for its sparsity: F = I + N where the only
+    non-zero entries of N are N[0,2] = N[1,3] = dt. F P F.T expands to
+    P + N P + P N.T + N P N.T, which only touches a handful of entries
+    instead of two dense 4x4 matmuls.
+    '''
+    x_new = np.empty_like(x)
+    x_new[0,0] = x[0,0] + dt*x[2,0]
+    x_new[1,0] = x[1,0] + dt*x[3,0]
+    x_new[2,0] = x[2,0]
+    x_new[3,0] = x[3,0]
+
+    P_new = P + Q
+    for j in range(4):
+        P_new[0,j] += dt*P[2,j]
+        P_new[1,j] += dt*P[3,j]
+    for i in range(4):
+        P_new[i,0] += dt*P[i,2]
+        P_new[i,1] += dt*P[i,3]
+    P_new[0,0] += dt*dt*P[2,2]
+    P_new[0,1] += dt*dt*P[2,3]
+    P_new[1,0] += dt*dt*P[3,2]
+    P_new[1,1] += dt*dt*P[3,3]
+    return x_new, P_new
+
+@njit(cache=True)
+def kfxy_update(x, P, z, R):
+    '''KFXY update specialized for H = [[0,0,1,0],[0,0,0,1]]: H only selects
+    x[2], x[3], so S = P[2:4,2:4] + R and K = P[:,2:4] @ inv(S) without any
+    dense matmul against H.
+    '''
+    y0 = z[0,0] - x[2,0]
+    y1 = z[1,0] - x[3,0]
+
+    S00 = P[2,2] + R[0,0]
+    S01 = P[2,3] + R[0,1]
+    S10 = P[3,2] + R[1,0]
+    S11 = P[3,3] + R[1,1]
+    det = S00*S11 - S01*S10
+
+    x_new = np.empty_like(x)
+    P_new = np.empty_like(P)
+    K = np.empty((4, 2))
+    for i in range(4):
+        K[i,0] = ( P[i,2]*S11 - P[i,3]*S10) / det
+        K[i,1] = (-P[i,2]*S01 + P[i,3]*S00) / det
+        x_new[i,0] = x[i,0] + K[i,0]*y0 + K[i,1]*y1
+    for i in range(4):
+        for j in range(4):
+            P_new[i,j] = P[i,j] - K[i,0]*P[2,j] - K[i,1]*P[3,j]
+    return x_new, P_new
+
+@njit(cache=True)
+def control_tick(tof_x, tof_P, tof_F, tof_B, tof_Q, dt, do_predict, run_pid,
+                 target_altitude, velocity, integral, kp, ki, kd, i_limit,
+                 limit, cancel_gravity, cos_tilt):
+    '''Numeric body of one vertical-control tick in a single jitted call:
+    ToF predict, throttle PID (same update rule as pid.PID.calc with a
+    velocity term), saturation and gravity compensation. Pipes, takeoff
+    sequencing and logging stay in the Python loop.
+    '''
+    x = tof_x
+    P = tof_P
+    altitude = x[0,0]
+    if do_predict:
+        # For init reading will very large, but normal case would not larger than 1s
+        # (was abs(dt<3), which takes abs of a bool -- meant abs(dt) < 3)
+        dt_eff = dt if abs(dt) < 3.0 else 0.0
+        tof_F[0,1] = dt_eff
+        tof_B[0,0] = 0.5*dt_eff*dt_eff
+        tof_B[1,0] = dt
+        x, P = kf_predict(x, P, tof_F, tof_B, tof_Q, 0.0) #Just test for non -9.81*(0.99-imu[0][2])
+        altitude = x[0,0]
+        velocity = x[1,0]
+
+    error_altitude = 0.0
+    next_throttle = 0.0
+    throttle = 0.0
+    if run_pid:
+        error_altitude = target_altitude - altitude
+        integral += ki * error_altitude / dt
+        if integral > i_limit:
+            integral = i_limit
+        elif integral < -i_limit:
+            integral = -i_limit
+        next_throttle = kp*error_altitude + integral + kd*(-velocity)
+        throttle = -limit if next_throttle < -limit else (limit if next_throttle > limit else next_throttle)
+        # Add the cancel gravity set point with the angle compensate
+        throttle += cancel_gravity / cos_tilt
+    return x, P, altitude, velocity, error_altitude, next_throttle, throttle, integral
+
+def drain_pipe(pipe):
+    '''Drain every pending message and return only the newest one (or None).
+    Stale sensor readings are useless, and reading them all at once avoids
+    one poll()/recv() syscall round-trip per message per tick.'''
+    msg = None
+    while pipe.poll():
+        msg = pipe.recv()
+    return msg
+
+def drain_pipe_all(pipe):
+    '''Drain every pending message and return them all (oldest first).
+    Lets the caller fuse a backlog into a single batched update instead of
+    running one filter update per message or discarding the older ones.'''
+    msgs = []
+    while pipe.poll():
+        msgs.append(pipe.recv())
+    return msgs
+
+def drain_pipe_bytes(pipe):
+    '''Same as drain_pipe but for raw struct-packed payloads (recv_bytes
+    skips the pickle round-trip entirely).'''
+    msg = None
+    while pipe.poll():
+        msg = pipe.recv_bytes()
+    return msg
+
 class control():
 
     def __init__(self):
         ''' Define all the parameter'''
-        '''Basic parameter'''''
-        self.PERIOD = 1/200               # Sleeping time
-        self.ABS_MAX_VALUE_ROLL = 250      # PID Roll limit
-        self.ABS_MAX_VALUE_PITCH = 250     # PID Pitch limit
-        self.ABS_MAX_VALUE_THROTTLE = 300 # PID Throttle limit
-
         '''Takeoff parameter'''
-        self.TAKEOFF_ALTITUDE = 0.7#m     # Take off altitude
-        self.TAKEOFF_THRUST = 360 #12.35V ->360  # 11.6V -> 400 #11.31 -> 410 # weight -> 340 # 420 is too much for takeoff
-        self.TAKEOFF_LIST = np.zeros(10)  # Creating the take off curve
-        for t in range(len(self.TAKEOFF_LIST)):
-            self.TAKEOFF_LIST[t] = ((1-(1/np.exp(t))))# act like a cap-charge shape
-        self.TAKEOFF_LIST = self.TAKEOFF_LIST.tolist()
+        self.TAKEOFF_LIST = 1.0 - np.exp(-np.arange(10.0)) # Take off curve, act like a cap-charge shape
+        self.TAKEOFF_IDX = 0              # Cursor into the take off curve (O(1), no pop(0) memmove)
 
         '''init takeoff and landing'''
         self.TAKEOFF = True
@@ -33,15 +221,9 @@ class control():
         self.DATA = False
         self.data = []
 
-        '''ToF sensor offset'''
-        # CogniFly offset -> z: -40mm, y: +38mm
-        # self.TOFOFFSET_Z = 0.04 #m
-        # self.TOFOFFSET_Y = 0.038 #m
-        self.TOFOFFSET_Z = -0.02 #m
-        self.TOFOFFSET_Y = -0.045 #m
-
-        self.TOFOFFSET_R = np.sqrt(self.TOFOFFSET_Z**2 + self.TOFOFFSET_Y**2)
-        self.TOFOFFSET_ANGLE = np.tan(self.TOFOFFSET_Z/self.TOFOFFSET_Y)
+        '''Debug printing (gated: stdout writes in the hot loop are costly)'''
+        self.DEBUG = False
+        self._tick = 0
 
         '''Alpha Filter'''
         self.a = 1
@@ -51,77 +233,58 @@ class control():
         self.OF_TIME  = 0 # Optical Flow Timestamp
         self.TOF_Time = 0 # Time of Flight Timestamp
 
-        '''PID'''
-        #Pitch PID G0
-        self.PX_GAIN = 90
-        self.IX_GAIN = 0.
-        self.DX_GAIN = 103 
-        #Roll PID Gain
-        self.PY_GAIN = 90
-        self.IY_GAIN = 0.
-        self.DY_GAIN = 103
-        #Altitude PID Gain
-        # For 2S battery
-        self.PZ_GAIN = 60
-        self.IZ_GAIN = 0.19
-        self.DZ_GAIN = 35
-                
-        '''IMU value init''' 
-        self.imu = [[0,0,0],[0,0,0],[0,0,0]]
+        '''IMU value init'''
+        # contiguous (3,3) array: rows are acc, gyro, attitude
+        self.imu = np.zeros((3, 3))
 
     def tof_filter_init(self):
-        '''ToF Filter'''
+        '''ToF Filter (plain ndarrays, used with kf_predict/kf_update)'''
         dt = 0.01                                                    # Just random assumation
-        tof_filter = KalmanFilter(dim_x = 2, dim_z = 2, dim_u = 1)   # Set up the ToF filter
-        tof_filter.F = np.array([[1, dt],                            # The Sensor Model
-                                [0, 1]])
-                    
-        tof_filter.P = np.diag([0.1, 0.1])                          # covariance matrix
-        tof_filter.B = np.array([[0],                                # Control Matrix
-                                [dt]]) 
-        tof_filter.H = np.diag([1., 1.])                             # Measurement Matrix
-        tof_filter.Q = np.diag([0.9, 0.4])                           # Process covariance
-        tof_filter.R = np.diag([0.02**2, 0.05**2])                   # Measurement covariance  # Noise of he sensor ~0.01m (1cm)
-        return tof_filter
+        tof_x = np.zeros((2, 1))                                     # State
+        tof_F = np.array([[1, dt],                                   # The Sensor Model
+                          [0, 1]])
+
+        tof_P = np.eye(2) * 0.1                                      # covariance matrix
+        tof_B = np.array([[0],                                       # Control Matrix
+                          [dt]])
+        tof_H = np.eye(2)                                            # Measurement Matrix
+        tof_Q = np.zeros((2, 2))                                     # Process covariance
+        tof_Q[0, 0] = 0.9
+        tof_Q[1, 1] = 0.4
+        tof_R = np.zeros((2, 2))                                     # Measurement covariance  # Noise of he sensor ~0.01m (1cm)
+        tof_R[0, 0] = 0.02**2
+        tof_R[1, 1] = 0.05**2
+        return tof_x, tof_P, tof_F, tof_B, tof_H, tof_Q, tof_R
 
     def xy_of_filter_init(self):
-        '''XY Filter'''
-        KFXY = KalmanFilter(dim_x = 4, dim_z = 2, dim_u = 1)         # Set up the XY filter
-        KFXY.x = np.array([ [0], #dx(pitch)
+        '''XY Filter (plain ndarrays, used with kf_predict/kf_update)'''
+        KFXY_x = np.array([ [0], #dx(pitch)
                             [0], #dy(roll)
                             [0], #vx(pitch)
                             [0]],#vy(roll)
                             dtype=float)
 
-        KFXY.F = np.diag([1., 1., 1., 1.])
-        KFXY.P = np.diag([.9, .9, 1., 1.])
-        KFXY.B = np.diag([1., 1., 1., 1.]) 
-        KFXY.H = np.array([[0, 0, 1., 0], 
-                        [0, 0, 0, 1.]]) 
-        KFXY.Q *= 0.1**2
-        KFXY.R *= 0.01**2
+        KFXY_F = np.eye(4)
+        KFXY_P = np.eye(4)
+        KFXY_P[0, 0] = KFXY_P[1, 1] = .9
+        KFXY_B = np.eye(4)
+        KFXY_H = np.array([[0, 0, 1., 0],
+                        [0, 0, 0, 1.]])
+        KFXY_Q = np.eye(4) * 0.1**2
+        KFXY_R = np.eye(2) * 0.01**2
         KFXY_z = np.array([ [0.], # Update value of the XY filter
                             [0.]],dtype=float)
         KFXY_u = np.array([ [0.], # Control input for XY filter
                             [0.],
                             [0.],
                             [0.]],dtype=float)
-        
-        return KFXY, KFXY_z, KFXY_u # Filter, Filter_Sensor_varible, Control_input
+
+        return (KFXY_x, KFXY_P, KFXY_F, KFXY_B, KFXY_H, KFXY_Q, KFXY_R), KFXY_z, KFXY_u # Filter, Filter_Sensor_varible, Control_input
 
     def value_limit(self, output, limit):
-        '''Set the value not excite the limited value'''
-        if abs(output) >= limit:
-            if output < 0 :
-                output = -limit
-            else:
-                output = limit
-        return output 
+        '''Set the value not excite the limited value (no abs call, single compare chain)'''
+        return -limit if output < -limit else (limit if output > limit else output)
     
-    def truncate(self, data, dp = 2):
-        ''' Truncate the value down to 2 dp as default'''
-        return (int(data*(10**dp)))/(10**dp)
-
     def control_process(self, *args):
         '''This function will called from joystick_async as subprocess'''
         control_optflow_pipe_read, control_cv_pipe_read, control_tof_pipe_read, control_imu_pipe_read, ext_control_pipe_write, ext_control_pipe_read, nice_level = args
@@ -129,13 +292,21 @@ class control():
         os.nice(nice_level)
         
         # Init the ToF kalman filter
-        tof_filter = self.tof_filter_init()
-        KFXY, KFXY_z, KFXY_u = self.xy_of_filter_init()
+        tof_x, tof_P, tof_F, tof_B, tof_H, tof_Q, tof_R = self.tof_filter_init()
+        (KFXY_x, KFXY_P, KFXY_F, KFXY_B, KFXY_H, KFXY_Q, KFXY_R), KFXY_z, KFXY_u = self.xy_of_filter_init()
+
+        # Warm-up calls so the JIT compiles before the control loop starts
+        kf_predict(tof_x, tof_P, tof_F, tof_B, tof_Q, 0.0)
+        kf_update(tof_x, tof_P, tof_H, tof_R, KFXY_z)
+        kfxy_predict(KFXY_x, KFXY_P, 0.01, KFXY_Q)
+        kfxy_update(KFXY_x, KFXY_P, KFXY_z, KFXY_R)
+        control_tick(tof_x, tof_P, tof_F, tof_B, tof_Q, 0.01, True, True,
+                     0.0, 0.0, 0.0, 1.0, 1.0, 1.0, 100.0, 1.0, 0.0, 1.0)
 
         ''' PID Init '''
-        throttle_pd = PID(self.PZ_GAIN, self.IZ_GAIN, self.DZ_GAIN)    #throttle PID
-        roll_pd = PID(self.PY_GAIN, self.IY_GAIN, self.DY_GAIN)        #roll PID
-        pitch_pd = PID(self.PX_GAIN, self.IX_GAIN, self.DX_GAIN)       #pitch PID
+        throttle_pd = PID(PZ_GAIN, IZ_GAIN, DZ_GAIN)    #throttle PID
+        roll_pd = PID(PY_GAIN, IY_GAIN, DY_GAIN)        #roll PID
+        pitch_pd = PID(PX_GAIN, IX_GAIN, DX_GAIN)       #pitch PID
         prev_velocity_pitch = 0
         prev_velocity_roll = 0
         prev_error_roll = 0
@@ -149,12 +320,12 @@ class control():
         value_available = False
         postition_hold = False
         init_altitude = 0
+        cancel_gravity_value = 0 # set for real by the takeoff ramp
 
         '''CMDS init'''
-        CMDS = {'throttle': 0,
-                'roll':     0,
-                'pitch':    0}
+        CMDS = [0.0, 0.0, 0.0] # throttle, roll, pitch (see THR/ROL/PIT)
         prev_time = time.time()
+        next_tick = time.monotonic() # deadline scheduler, keeps the loop period drift-free
         OF_DIS = of_dis = 0
         # For init
         error_altitude = error_roll = error_pitch = velocity_pitch = velocity_roll = 0
@@ -163,11 +334,23 @@ class control():
         pre_roll = 0
         pre_pitch = 0
 
+        '''Cached trig of the IMU angles (refreshed once per IMU update)'''
+        roll_rad = pitch_rad = 0.0
+        cos_roll = cos_pitch = 1.0
+
+        # used until the first IMU message brings a battery voltage to
+        # compute the real value from
+        TAKEOFF_THRUST = DEFAULT_TAKEOFF_THRUST
+
+        '''Reusable ToF measurement buffer'''
+        tof_z = np.zeros((2, 1))
+
         while True:
-            CMDS['throttle'] = 0 
-            CMDS['roll']     = 0
+            self._tick += 1
+            CMDS[THR] = 0 
+            CMDS[ROL]  = 0
             # The betaflight config trim the pitch -10 for unbalance of the drone
-            CMDS['pitch']    = 0
+            CMDS[PIT]  = 0
             # Let the OF Pipe run
             control_tof_pipe_read.send('a')
             '''Read the joystick_node trigger the auto mode or not'''
@@ -179,18 +362,30 @@ class control():
                     init_altitude = None
             
             '''Update the IMU value'''
-            if control_imu_pipe_read.poll():
-                self.imu, battery_voltage, self.IMU_TIME = control_imu_pipe_read.recv() # [[accX,accY,accZ], [gyroX,gyroY,gyroZ], [roll,pitch,yaw]]
+            imu_msg = drain_pipe_bytes(control_imu_pipe_read)
+            if imu_msg is not None:
+                imu_vals = IMU_STRUCT.unpack(imu_msg) # accX..accZ, gyroX..gyroZ, roll,pitch,yaw, voltage, timestamp
+                self.imu[0] = imu_vals[0:3]
+                self.imu[1] = imu_vals[3:6]
+                self.imu[2] = imu_vals[6:9]
+                battery_voltage = imu_vals[9]
+                self.IMU_TIME = imu_vals[10]
                 #DEBUG USE
                 imut=time.time()
                 angu_time = prev_time-self.IMU_TIME
                 if angu_time > 0.001:
-                    angu_roll = (self.imu[2][0]-pre_roll)/angu_time
-                    angu_pitch = (self.imu[2][1]-pre_pitch)/angu_time
-                    pre_roll = self.imu[2][0]
-                    pre_pitch = self.imu[2][1]
+                    angu_roll = (self.imu[2,0]-pre_roll)/angu_time
+                    angu_pitch = (self.imu[2,1]-pre_pitch)/angu_time
+                    pre_roll = self.imu[2,0]
+                    pre_pitch = self.imu[2,1]
                 else:
                     angu_roll = angu_pitch = 0
+                # Cache the trig used below; stdlib math beats numpy ufunc
+                # dispatch on scalars and these are reused several times per tick
+                roll_rad = self.imu[2,0]*DEG2RAD
+                pitch_rad = self.imu[2,1]*DEG2RAD
+                cos_roll = math.cos(roll_rad)
+                cos_pitch = math.cos(pitch_rad)
                 if self.TAKEOFF:
                     # Tested voltage throttle relationship
                     TAKEOFF_THRUST = int(1015-60*(battery_voltage))
@@ -202,59 +397,64 @@ class control():
                 postition_hold = False
                 # initial value from the sensor
                 # the cognifly have the initial heigth of 0.11m
-                tof_filter.x = np.array([[init_altitude], 
-                                        [0]]) 
+                # (written in place, no fresh ndarray per reset)
+                tof_x[0,0] = init_altitude
+                tof_x[1,0] = 0.0
                 continue
 
             '''Vertical Movement Control'''
             if init_altitude:
-                # Update the ToF Filter
+                # Update the ToF Filter + throttle PID in one jitted call
                 dt = prev_time-self.TOF_Time
-                # For init reading will very large, but normal case would not larger than 1s
-                tof_filter.F[0,1] = dt if abs(dt<3) else 0
-                tof_filter.B[0] = 0.5*(dt**2) if abs(dt<3) else 0
-                tof_filter.B[1] = dt
-                tof_filter.predict(u = 0) #Just test for non -9.81*(0.99-imu[0][2])
-                # Capture the Predicted value
-                altitude = tof_filter.x[0,0]
-                velocity = tof_filter.x[1,0]
-                
-                # '''Takeoff Setting''' 
+                was_takeoff = self.TAKEOFF
+                tof_x, tof_P, altitude, velocity, error_altitude_t, next_throttle_t, throttle_t, integral_t = control_tick(
+                    tof_x, tof_P, tof_F, tof_B, tof_Q, dt, True, not was_takeoff,
+                    float(init_altitude), 0.0, throttle_pd.integral,
+                    throttle_pd.kp, throttle_pd.ki, throttle_pd.kd, float(throttle_pd.integral_threshold),
+                    float(ABS_MAX_VALUE_THROTTLE), float(cancel_gravity_value), cos_roll * cos_pitch)
+
+                # '''Takeoff Setting'''
                 if self.TAKEOFF:
-                    if len(self.TAKEOFF_LIST):
-                        CMDS['throttle'] = self.TAKEOFF_LIST[0] * TAKEOFF_THRUST
+                    if self.TAKEOFF_IDX < self.TAKEOFF_LIST.size:
+                        CMDS[THR] = self.TAKEOFF_LIST[self.TAKEOFF_IDX] * TAKEOFF_THRUST
                         value_available = True
-                        self.TAKEOFF_LIST.pop(0)
-                        cancel_gravity_value = CMDS['throttle']
+                        self.TAKEOFF_IDX += 1
+                        cancel_gravity_value = CMDS[THR]
                     else:
                         # control_optflow_pipe_read.send('a')
-                        init_altitude = self.TAKEOFF_ALTITUDE 
+                        init_altitude = TAKEOFF_ALTITUDE
                         velocity = 0
                         self.TAKEOFF = False
+                        # first PID tick right after takeoff: reuse the predicted
+                        # state, velocity forced to 0 like before
+                        _, _, altitude, velocity, error_altitude_t, next_throttle_t, throttle_t, integral_t = control_tick(
+                            tof_x, tof_P, tof_F, tof_B, tof_Q, dt, False, True,
+                            float(init_altitude), 0.0, throttle_pd.integral,
+                            throttle_pd.kp, throttle_pd.ki, throttle_pd.kd, float(throttle_pd.integral_threshold),
+                            float(ABS_MAX_VALUE_THROTTLE), float(cancel_gravity_value), cos_roll * cos_pitch)
 
                 # '''PID at Throttle'''
                 if (not self.TAKEOFF):
-                    error_altitude =  init_altitude - altitude # altitude
-                    next_throttle = throttle_pd.calc(error_altitude, time = dt, velocity=-velocity) 
-                    # Set throttle by PID control
-                    CMDS['throttle'] = self.value_limit(next_throttle, self.ABS_MAX_VALUE_THROTTLE)
-                    # Add the cancel gravity set point with the angle compensate
-                    CMDS['throttle'] += cancel_gravity_value / ((np.cos(self.imu[2][0]*np.pi*1/180)) * (np.cos(self.imu[2][1]*np.pi*1/180)))
-                    value_available = True 
+                    error_altitude = error_altitude_t
+                    next_throttle = next_throttle_t
+                    throttle_pd.integral = integral_t
+                    # Set throttle by PID control (saturated + gravity compensated)
+                    CMDS[THR] = throttle_t
+                    value_available = True
                     prev_altitude_sensor = altitude_corrected
 
             # LANDING
             if not self.TAKEOFF and self.LANDING:
-                CMDS['throttle'] = cancel_gravity_value + (15/(altitude+0.5))
+                CMDS[THR] = cancel_gravity_value + (15/(altitude+0.5))
         
             '''Update the ToF value'''
-            if control_tof_pipe_read.poll():
+            tof_msg = drain_pipe(control_tof_pipe_read)
+            if tof_msg is not None:
                 if not init_altitude:
-                    altitude_sensor, self.TOF_Time = control_tof_pipe_read.recv() # Flushing the old value 
-                    # altitude_sensor = control_tof_pipe_read.recv() # Flushing the old value 
+                    altitude_sensor, self.TOF_Time = tof_msg # Flushing the old value 
                 else:
                     # turning the altitdue back to ground, reference as global coordinate
-                    altitude_sensor, self.TOF_Time = control_tof_pipe_read.recv()
+                    altitude_sensor, self.TOF_Time = tof_msg
                     #DEBUG USE
                     toft=time.time()
                     # The sensor is not at the center axis of rotation
@@ -263,9 +463,12 @@ class control():
                     # PITCH: (Measure - offset) * cos(pitch_angle) 
                     # combine: (Measure * cos(roll) * cos(pitch)) - (offset * sin(sensor-roll) * cos(pitch))
                     # CogniFly offset -> z: -40mm, y: +38mm
-                    altitude_corrected = altitude_sensor * (np.cos(self.imu[2][0]*np.pi*1/180)) * (np.cos(self.imu[2][1]*np.pi*1/180))
-                    offset = self.TOFOFFSET_R * np.sin(self.TOFOFFSET_ANGLE - (self.imu[2][0]*np.pi*1/180)) * (np.cos(self.imu[2][1]*np.pi*1/180))
-                    tof_filter.update([self.truncate(altitude_corrected-offset), self.truncate(((altitude_corrected-offset)-prev_altitude_sensor)/dt)])
+                    # pure scalar math, written into the preallocated buffer
+                    altitude_corrected = altitude_sensor * cos_roll * cos_pitch
+                    z0 = altitude_corrected - TOFOFFSET_R * math.sin(TOFOFFSET_ANGLE - roll_rad) * cos_pitch
+                    tof_z[0,0] = round(z0, 2)
+                    tof_z[1,0] = round((z0 - prev_altitude_sensor)/dt, 2)
+                    tof_x, tof_P = kf_update(tof_x, tof_P, tof_H, tof_R, tof_z)
                         
             '''Update the XY Filter'''
             # if ((not TAKEOFF) and (abs(error_altitude) < 0.2)):
@@ -273,70 +476,82 @@ class control():
                 # For init reading will very large, but normal case would not larger than 1s
                 dt_OF = prev_time-self.OF_TIME
                 dt_IMU = prev_time-self.IMU_TIME
-                # KFXY.R[0,0] = (0.005+(velocity/90)) # Increase the noise for the filter when up and down 
-                # KFXY.R[1,1] = (0.005+(velocity/90))
+                # KFXY_R[0,0] = (0.005+(velocity/90)) # Increase the noise for the filter when up and down 
+                # KFXY_R[1,1] = (0.005+(velocity/90))
                 # # For init reading will very large, but normal case would not larger than 1s
-                # KFXY.F[0,2] = dt_OF if abs(dt_OF<3) else 0
-                # KFXY.F[1,3] = dt_OF if abs(dt_OF<3) else 0
-                # KFXY.B[2,2] = dt_IMU if abs(dt_IMU<3) else 0
-                # KFXY.B[3,3] = dt_IMU if abs(dt_IMU<3) else 0
+                # # (kfxy_predict/kfxy_update take dt directly, no F/B writes needed)
                 # # Another angular speed can be optained by (atitude/dt)
                 # # linear speed can be optained by angluar_speed*height
-                # KFXY_u[2,0] = self.truncate(9.81*(self.imu[0][0])*np.cos(self.imu[2][1])) #imu[0][0]->ax Pitch acc #imu[2][1]->Pitch angle
-                # KFXY_u[3,0] = self.truncate(9.81*(self.imu[0][1])*np.cos(self.imu[2][0])) #imu[0][1]->ay Roll acc  #imu[2][0]->Roll angle
-                if control_optflow_pipe_read.poll():
-                    KFXY_z[0,0], KFXY_z[1,0], of_dis, self.OF_TIME = control_optflow_pipe_read.recv() # it will block until a brand new value comes.
+                # KFXY_u[2,0] = round(9.81*(self.imu[0,0])*np.cos(self.imu[2,1]), 2) #imu[0][0]->ax Pitch acc #imu[2][1]->Pitch angle
+                # KFXY_u[3,0] = round(9.81*(self.imu[0,1])*np.cos(self.imu[2,0]), 2) #imu[0][1]->ay Roll acc  #imu[2][0]->Roll angle
+                of_msgs = drain_pipe_all(control_optflow_pipe_read)
+                if of_msgs:
+                    # More than one OF frame can land between ticks; fuse them
+                    # into a single averaged measurement (one filter update
+                    # absorbs the numpy overhead once) instead of keeping only
+                    # the newest. The per-frame displacements are summed so no
+                    # travelled distance is lost.
+                    zx = zy = of_dis = 0.0
+                    for msg in of_msgs:
+                        zx += msg[0]
+                        zy += msg[1]
+                        of_dis += msg[2]
+                    n = len(of_msgs)
+                    KFXY_z[0,0] = zx/n
+                    KFXY_z[1,0] = zy/n
+                    self.OF_TIME = of_msgs[-1][3]
                     #DEBUG USE
                     oft=time.time()
-                    # KFXY.update(KFXY_z*(-altitude))# To real scale # X-Y reversed
+                    # KFXY_x, KFXY_P = kfxy_update(KFXY_x, KFXY_P, KFXY_z*(-altitude), KFXY_R)# To real scale # X-Y reversed
                 
-                # KFXY.predict(u=0)#KFXY_u) # [dx, dy, vx, vy]
+                # KFXY_x, KFXY_P = kfxy_predict(KFXY_x, KFXY_P, (dt_OF if abs(dt_OF) < 3.0 else 0.0), KFXY_Q) # [dx, dy, vx, vy]
 
                 OF_DIS += of_dis*altitude
                 '''X-Y control'''
                 factor = 1.6 #Seem the data is scaled up 1.6 times 
 
-                error_roll  = self.truncate((OF_DIS[1])/factor)
-                error_pitch = self.truncate((OF_DIS[0])/factor)
-                velocity_roll_tmp = self.truncate(KFXY_z[1,0]*(-altitude))
-                velocity_pitch_tmp = self.truncate(KFXY_z[0,0]*(-altitude))
+                error_roll  = round((OF_DIS[1])/factor, 2)
+                error_pitch = round((OF_DIS[0])/factor, 2)
+                velocity_roll_tmp = round(KFXY_z[1,0]*(-altitude), 2)
+                velocity_pitch_tmp = round(KFXY_z[0,0]*(-altitude), 2)
                 self.a = np.exp(-abs(velocity_pitch_tmp - velocity_pitch))
                 velocity_pitch += self.a * (velocity_pitch_tmp - velocity_pitch)
                 self.a = np.exp(-abs(velocity_roll_tmp - velocity_roll))
                 velocity_roll  += self.a * (velocity_roll_tmp - velocity_roll)
                 # prev_error_roll = error_roll
                 # prev_error_pitch = error_pitch
-                # velocity_roll_tmp = -self.truncate((error_roll-prev_error_roll)/dt_OF)
-                # velocity_pitch_tmp = -self.truncate((error_pitch-prev_error_pitch)/dt_OF)
+                # velocity_roll_tmp = -round((error_roll-prev_error_roll)/dt_OF, 2)
+                # velocity_pitch_tmp = -round((error_pitch-prev_error_pitch)/dt_OF, 2)
                 # velocity_roll += self.a*(velocity_roll_tmp - prev_velocity_roll)
                 # velocity_pitch += self.a*(velocity_pitch_tmp - prev_velocity_pitch)
                 # prev_velocity_roll = velocity_roll
                 # prev_velocity_pitch = velocity_pitch
-                # velocity_roll = self.truncate(KFXY.x[3,0])
-                # velocity_pitch = self.truncate(KFXY.x[2,0])
+                # velocity_roll = round(KFXY_x[3,0], 2)
+                # velocity_pitch = round(KFXY_x[2,0], 2)
 
                 # The new cognifly is reversed the pi orientation
                 next_roll = roll_pd.calc(-error_roll, velocity=velocity_roll) # Y
                 next_pitch = pitch_pd.calc(-error_pitch, velocity=velocity_pitch) # X
-                CMDS['roll'] = next_roll if abs(next_roll) <= self.ABS_MAX_VALUE_ROLL else (-1 if next_roll < 0 else 1)*self.ABS_MAX_VALUE_ROLL 
-                CMDS['pitch'] = next_pitch if abs(next_pitch) <= self.ABS_MAX_VALUE_PITCH else (-1 if next_pitch < 0 else 1)*self.ABS_MAX_VALUE_PITCH 
+                CMDS[ROL] = -ABS_MAX_VALUE_ROLL if next_roll < -ABS_MAX_VALUE_ROLL else (ABS_MAX_VALUE_ROLL if next_roll > ABS_MAX_VALUE_ROLL else next_roll)
+                CMDS[PIT] = -ABS_MAX_VALUE_PITCH if next_pitch < -ABS_MAX_VALUE_PITCH else (ABS_MAX_VALUE_PITCH if next_pitch > ABS_MAX_VALUE_PITCH else next_pitch)
                 value_available = True
                 
-                print (">>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>\n")     
-                print ("OF Distance: ",OF_DIS)  
-                print("THROTTLE :{2:.2f}    | ALT:{1:.2f}   |   ERR:{0:.2f}     |   Vec:{3:.2f}".format(error_altitude, altitude, next_throttle, velocity))
-                print("dt_OF:{:.2f} |   dt_IMU:{:.2f}".format(dt_OF,dt_IMU))
-                print("Angular Roll: {:.2f}     |   Pitch: {:.2f}".format(angu_roll, angu_pitch))
-                print("ERROR ROLL : %2.2f  error|  %2.2f roll|  %2.2f of" %(error_roll, next_roll, 0))
-                print("ERROR PITCH: %2.2f  error|  %2.2f pitch|  %2.2f of" %(error_pitch, next_pitch, 0))
-                print("ROLL velocity: ", -KFXY.x[3,0], KFXY_z[1,0]*(-altitude), self.truncate((self.imu[2][0]*np.pi*1/180*altitude/dt)))
-                print("PITCH velocity", -KFXY.x[2,0], KFXY_z[0,0]*(-altitude), self.truncate((self.imu[2][1]*np.pi*1/180*altitude/dt)))
-                print("TIME:{0:1.2f}  |  OF:{1:.2f}   |   IMU:{2:.2f}    |   TOF:{3:.2f}".format(time.time(), 
-                                                                                            (self.OF_TIME-oft), 
-                                                                                            (self.IMU_TIME-imut),
-                                                                                            (self.TOF_Time -toft)))
+                if self.DEBUG and self._tick % 100 == 0:
+                    print (">>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>>\n")
+                    print ("OF Distance: ",OF_DIS)
+                    print("THROTTLE :{2:.2f}    | ALT:{1:.2f}   |   ERR:{0:.2f}     |   Vec:{3:.2f}".format(error_altitude, altitude, next_throttle, velocity))
+                    print("dt_OF:{:.2f} |   dt_IMU:{:.2f}".format(dt_OF,dt_IMU))
+                    print("Angular Roll: {:.2f}     |   Pitch: {:.2f}".format(angu_roll, angu_pitch))
+                    print("ERROR ROLL : %2.2f  error|  %2.2f roll|  %2.2f of" %(error_roll, next_roll, 0))
+                    print("ERROR PITCH: %2.2f  error|  %2.2f pitch|  %2.2f of" %(error_pitch, next_pitch, 0))
+                    print("ROLL velocity: ", -KFXY_x[3,0], KFXY_z[1,0]*(-altitude), round(self.imu[2,0]*DEG2RAD*altitude/dt, 2))
+                    print("PITCH velocity", -KFXY_x[2,0], KFXY_z[0,0]*(-altitude), round(self.imu[2,1]*DEG2RAD*altitude/dt, 2))
+                    print("TIME:{0:1.2f}  |  OF:{1:.2f}   |   IMU:{2:.2f}    |   TOF:{3:.2f}".format(time.time(), 
+                                                                                                (self.OF_TIME-oft), 
+                                                                                                (self.IMU_TIME-imut),
+                                                                                                (self.TOF_Time -toft)))
                 
-                self.data.append((CMDS['throttle'], CMDS['roll'], CMDS['pitch'], altitude, error_altitude, velocity, 
+                self.data.append((CMDS[THR], CMDS[ROL], CMDS[PIT], altitude, error_altitude, velocity, 
                                   error_roll, velocity_roll, angu_roll,
                                   error_pitch, velocity_pitch, angu_pitch))
 
@@ -347,7 +562,11 @@ class control():
             
             '''Send out the CMDS values back to the joystick loop'''
             if value_available and (not ext_control_pipe_read.poll()):
-                ext_control_pipe_write.send(CMDS)
+                ext_control_pipe_write.send_bytes(CMDS_STRUCT.pack(*CMDS))
                 value_available = False
-            time.sleep(self.PERIOD)
-            prev_time = time.time()  
\ No newline at end of file
+            # Sleep until the next absolute deadline instead of a fixed PERIOD
+            # after variable loop work: keeps the tick rate (and therefore the
+            # filter dt) stable instead of drifting with load.
+            next_tick += PERIOD
+            time.sleep(max(0.0, next_tick - time.monotonic()))
+            prev_time = time.time()
@@ -1,4 +1,5 @@
 import asyncio
+import struct
 import time
 import signal
 from collections import deque
@@ -58,6 +59,10 @@ CMDS = CMDS_init.copy()
 # I'm not sure if this order changes according to the configurations made to betaflight...
 CMDS_ORDER = ['roll', 'pitch', 'throttle', 'yaw', 'aux1', 'aux2', 'aux3', 'aux4']
 
+# Fixed-size binary payloads exchanged with the control node (see control_node.py)
+IMU_STRUCT = struct.Struct('<11d')
+CMDS_STRUCT = struct.Struct('<3d')
+
 try:
     gamepad = InputDevice('/dev/input/event2')
 except FileNotFoundError:
@@ -134,17 +139,17 @@ async def joystick_interface(dev, ext_contr_pipe = None):
             if ext_contr_pipe: 
                 # process info from external controller
                 if ext_contr_pipe.poll():
-                    cmds_pipe = ext_contr_pipe.recv()
+                    pipe_throttle, pipe_roll, pipe_pitch = CMDS_STRUCT.unpack(ext_contr_pipe.recv_bytes())
                     if ('pitch' in AUTONOMOUS_INPUT):
                         # The received commands will always actuate around the center positions
-                        CMDS['pitch'] = CMDS_init['pitch'] + cmds_pipe['pitch']
+                        CMDS['pitch'] = CMDS_init['pitch'] + pipe_pitch
                     if ('roll' in AUTONOMOUS_INPUT):
                         # The received commands will always actuate around the center positions
-                        CMDS['roll'] = CMDS_init['roll'] + cmds_pipe['roll']
+                        CMDS['roll'] = CMDS_init['roll'] + pipe_roll
                     if ('throttle' in AUTONOMOUS_INPUT):
-                        if cmds_pipe['throttle'] >= 0.0: # it doesn't make sense negative values here
+                        if pipe_throttle >= 0.0: # it doesn't make sense negative values here
                             # The received commands will always actuate FROM the default min value
-                            CMDS['throttle'] = CMDS_init['throttle'] + cmds_pipe['throttle']
+                            CMDS['throttle'] = CMDS_init['throttle'] + pipe_throttle
             
                     frequencies_measurement['autonomous'] = time.time() - prev_time_ext
                     prev_time_ext = time.time()
@@ -424,11 +429,11 @@ async def send_cmds_to_fc(pipes):
                             # accelerometer = board.SENSOR_DATA['accelerometer']
                             # gyroscope = board.SENSOR_DATA['gyroscope']
                             # attitude = board.SENSOR_DATA['kinematics']
-                            pipe_write.send(((board.SENSOR_DATA['accelerometer'],
-                                             board.SENSOR_DATA['gyroscope'],
-                                             board.SENSOR_DATA['kinematics']),
-                                             mean_voltage,
-                                             time.time()))
+                            pipe_write.send_bytes(IMU_STRUCT.pack(*board.SENSOR_DATA['accelerometer'],
+                                                                  *board.SENSOR_DATA['gyroscope'],
+                                                                  *board.SENSOR_DATA['kinematics'],
+                                                                  mean_voltage,
+                                                                  time.time()))
 
                         frequencies_measurement['send_cmds_to_fc'] = time.time() - prev_time
                         prev_time = time.time()
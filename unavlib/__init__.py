@@ -47,16 +47,14 @@ import logging
 import struct
 import time
 import sys
+from collections import namedtuple
+from functools import lru_cache, partial
 from select import select
 
-from threading import Lock, RLock
+from threading import Lock
 
-if "linux" in sys.platform:
-    import ctypes
-    ffs = ctypes.cdll.LoadLibrary('libc.so.6').ffs # this is only for ffs... it should be directly implemented.
-else:
-    def ffs(x): # modified from https://stackoverflow.com/a/36059264
-        return (x&-x).bit_length()
+def ffs(x): # modified from https://stackoverflow.com/a/36059264
+    return (x&-x).bit_length()
 
 from serial import SerialException
 
@@ -64,12 +62,227 @@ from . import msp_ctrl
 from . import msp_codes
 from . import msp_vars
 
+# Precompiled Structs for readbytes: parsing a format string on every field of
+# every received message adds up fast. Keyed by (size, unsigned) -- or
+# (size, 'float') for the special float reads like MSP2_INAV_DEBUG.
+_READBYTES_STRUCTS = {
+    (8,  False):   struct.Struct('<b'),
+    (8,  True):    struct.Struct('<B'),
+    (16, False):   struct.Struct('<h'),
+    (16, True):    struct.Struct('<H'),
+    (16, 'float'): struct.Struct('<e'),
+    (32, False):   struct.Struct('<i'),
+    (32, True):    struct.Struct('<I'),
+    (32, 'float'): struct.Struct('<f'),
+}
+
+# Precompiled Structs for the fast_read_* telemetry hot path. The payload
+# starts at byte 5 of the raw frame ($ + M + > + length + code), so these are
+# used with unpack_from(msg, 5) -- no msg[5:] / msg[:-1] slice copies.
+_ALTITUDE_STRUCT = struct.Struct('<i')
+_IMU_STRUCT = struct.Struct('<9h')
+_ATTITUDE_STRUCT = struct.Struct('<3h')
+_ANALOG_BF_STRUCT = struct.Struct('<B2HhH')
+_ANALOG_INAV_STRUCT = struct.Struct('<B2Hh')
+
+_UINT_FORMATS = {8: 'B', 16: 'H', 32: 'I'}
+
+@lru_cache(maxsize=None)
+def _uint_struct(count, n):
+    """Cached Struct for count little-endian n-bit unsigned values."""
+    return struct.Struct('<%d%s' % (count, _UINT_FORMATS[n]))
+
+@lru_cache(maxsize=None)
+def _u16_struct(n):
+    """Cached '<nH' Struct for the variable-length uint16 payloads (RC
+    channels, motors, servos)."""
+    return struct.Struct('<%dH' % n)
+
+# One precompiled Struct per fixed-layout MSP message: the whole payload is
+# unpacked with a single C call instead of one readbytes call per field.
+_STATUS_STRUCT = struct.Struct('<3HIB')
+_STATUS_EX_STRUCT = struct.Struct('<3HIBH') # common prefix, tail is BF/INAV specific
+_INAV_STATUS_STRUCT = struct.Struct('<4HBII')
+_ANALOG_BF_MSG_STRUCT = struct.Struct('<BHHhH')
+_ANALOG_INAV_MSG_STRUCT = struct.Struct('<BHHh')
+_BATTERY_STATE_STRUCT = struct.Struct('<BHHHBH')
+_VOLTAGE_METER_STRUCT = struct.Struct('<BB')
+_CURRENT_METER_STRUCT = struct.Struct('<BHH')
+_SERVO_CONFIG_STRUCT = struct.Struct('<3HbBI') # 12 bytes per servo
+_RAW_GPS_STRUCT = struct.Struct('<BBiiHHH')
+_COMP_GPS_STRUCT = struct.Struct('<HHB')
+_GPSSTATISTICS_STRUCT = struct.Struct('<HIIIHHH')
+_ALTITUDE_MSG_STRUCT = struct.Struct('<ih')
+_SONAR_STRUCT = struct.Struct('<i')
+_MOTOR_CONFIG_STRUCT = struct.Struct('<HHHBBBB')
+_SERIAL_PORT_STRUCT = struct.Struct('<BHBBBB') # identifier, function mask, 4 baud rate indices
+_MISC_STRUCT = struct.Struct('<5H6Bh4B') # 22 bytes
+_INAV_MISC_STRUCT = struct.Struct('<5H4BhHBB4H3IB')
+_DEBUG_STRUCT = struct.Struct('<4h')
+_INAV_DEBUG_STRUCT = struct.Struct('<8i')
+_UID_STRUCT = struct.Struct('<3I')
+_ACC_TRIM_STRUCT = struct.Struct('<2h')
+_ADVANCED_CONFIG_STRUCT = struct.Struct('<4BHH')
+_MODE_RANGE_STRUCT = struct.Struct('<4B')
+_MODE_RANGE_EXTRA_STRUCT = struct.Struct('<3B')
+_ADJUSTMENT_RANGE_STRUCT = struct.Struct('<6B')
+_RXFAIL_STRUCT = struct.Struct('<BH')
+# FILTER_CONFIG / PID_ADVANCED: one Struct + key tuple per firmware variant,
+# bound into the dispatch table once the flight controller type is known.
+# Where a field appears twice (e.g. the u16 re-read of gyro_lowpass_hz or
+# dtermSetpointWeight on BF) the later value wins, as in the old field order.
+_FILTER_CONFIG_COMMON = ('gyro_lowpass_hz', 'dterm_lowpass_hz', 'yaw_lowpass_hz',
+                         'gyro_notch_hz', 'gyro_notch_cutoff',
+                         'dterm_notch_hz', 'dterm_notch_cutoff',
+                         'gyro_notch2_hz', 'gyro_notch2_cutoff')
+_FILTER_CONFIG_STRUCT_INAV = struct.Struct('<B11H')
+_FILTER_CONFIG_KEYS_INAV = _FILTER_CONFIG_COMMON + (
+    'accNotchHz', 'accNotchCutoff', 'gyroStage2LowpassHz')
+_FILTER_CONFIG_STRUCT_BF = struct.Struct('<B8H2Bx2H2BHB4H') # 'x' skips the unused byte
+_FILTER_CONFIG_KEYS_BF = _FILTER_CONFIG_COMMON + (
+    'dterm_lowpass_type', 'gyro_hardware_lpf',
+    'gyro_lowpass_hz', 'gyro_lowpass2_hz', 'gyro_lowpass_type',
+    'gyro_lowpass2_type', 'dterm_lowpass2_hz', 'dterm_lowpass2_type',
+    'gyro_lowpass_dyn_min_hz', 'gyro_lowpass_dyn_max_hz',
+    'dterm_lowpass_dyn_min_hz', 'dterm_lowpass_dyn_max_hz')
+_PID_ADVANCED_COMMON = ('rollPitchItermIgnoreRate', 'yawItermIgnoreRate',
+                        'yaw_p_limit', 'deltaMethod', 'vbatPidCompensation')
+_PID_ADVANCED_STRUCT_INAV = struct.Struct('<3H4BHB2H')
+_PID_ADVANCED_KEYS_INAV = _PID_ADVANCED_COMMON + (
+    'setpointRelaxRatio', 'dtermSetpointWeight', 'pidSumLimit',
+    'itermThrottleGain', 'axisAccelerationLimitRollPitch',
+    'axisAccelerationLimitYaw')
+_PID_ADVANCED_STRUCT_BF = struct.Struct('<3H7B2H2B3H7B3H8B')
+_PID_ADVANCED_KEYS_BF = _PID_ADVANCED_COMMON + (
+    'feedforwardTransition', 'dtermSetpointWeight', 'toleranceBand',
+    'toleranceBandReduction', 'itermThrottleGain',
+    'pidMaxVelocity', 'pidMaxVelocityYaw',
+    'levelAngleLimit', 'levelSensitivity',
+    'itermThrottleThreshold', 'itermAcceleratorGain', 'dtermSetpointWeight',
+    'itermRotation', 'smartFeedforward', 'itermRelax', 'itermRelaxType',
+    'absoluteControlGain', 'throttleBoost', 'acroTrainerAngleLimit',
+    'feedforwardRoll', 'feedforwardPitch', 'feedforwardYaw',
+    'antiGravityMode', 'dMinRoll', 'dMinPitch', 'dMinYaw', 'dMinGain',
+    'dMinAdvance', 'useIntegratedYaw', 'integratedYawRelax')
+_DATAFLASH_SUMMARY_STRUCT = struct.Struct('<B3I')
+_SDCARD_SUMMARY_STRUCT = struct.Struct('<3B2I')
+
+# mode/adjustment range endpoints come as 900 + step*25; only 256 inputs exist
+_PWM_LUT = tuple(900 + i * 25 for i in range(256))
+# channel range of a mode or adjustment slot, in PWM microseconds
+ChannelRange = namedtuple('ChannelRange', ('start', 'end'))
+# RX_CONFIG: common 23-byte prefix, then receiver_type (INAV) or the six
+# rc-smoothing bytes (BF). Keys are zipped with the unpacked tuple.
+_RX_CONFIG_STRUCT_INAV = struct.Struct('<BHHHBHHBBHBIBBB')
+_RX_CONFIG_KEYS_INAV = (
+    'serialrx_provider',
+    'stick_max', # maxcheck for INAV
+    'stick_center', # midrc for INAV
+    'stick_min', # mincheck for INAV
+    'spektrum_sat_bind', 'rx_min_usec', 'rx_max_usec',
+    'rcInterpolation', 'rcInterpolationInterval', 'airModeActivateThreshold',
+    'rxSpiProtocol', # spirx_protocol for INAV
+    'rxSpiId', # spirx_id for INAV
+    'rxSpiRfChannelCount', # spirx_channel_count for INAV
+    'fpvCamAngleDegrees', 'receiver_type')
+_RX_CONFIG_STRUCT_BF = struct.Struct('<BHHHBHHBBHBIBB6B')
+_RX_CONFIG_KEYS_BF = _RX_CONFIG_KEYS_INAV[:-1] + (
+    'rcInterpolationChannels', 'rcSmoothingType', 'rcSmoothingInputCutoff',
+    'rcSmoothingDerivativeCutoff', 'rcSmoothingInputType',
+    'rcSmoothingDerivativeType')
+
 class MSPy:
     MSPCodes = msp_codes.MSPCodes
     MSPCodes2Str = msp_codes.MSPCodes2Str
 
     SIGNATURE_LENGTH = 32
 
+    # Fixed-layout messages that only fill a dict attribute, described as data
+    # instead of one handler method each: target attribute, payload Struct and
+    # the dict keys in wire order. All of them share _process_fixed.
+    _FIXED_SPECS = {
+        'MSP_GPS_CONFIG': ('GPS_CONFIG', struct.Struct('<4B'),
+                           ('provider', 'ublox_sbas', 'auto_config', 'auto_baud')),
+        'MSP_RSSI_CONFIG': ('RSSI_CONFIG', struct.Struct('<B'),
+                            ('channel',)),
+        'MSP_PID_CONTROLLER': ('PID', struct.Struct('<B'),
+                               ('controller',)),
+        'MSP_RC_DEADBAND': ('RC_DEADBAND_CONFIG', struct.Struct('<3BH'),
+                            ('deadband', 'yaw_deadband', 'alt_hold_deadband',
+                             'deadband3d_throttle')),
+        'MSP_FAILSAFE_CONFIG': ('FAILSAFE_CONFIG', struct.Struct('<BBHBHB'),
+                                ('failsafe_delay', 'failsafe_off_delay',
+                                 'failsafe_throttle', 'failsafe_switch_mode',
+                                 'failsafe_throttle_low_delay', 'failsafe_procedure')),
+        'MSP_GPS_RESCUE': ('GPS_RESCUE', struct.Struct('<7H2B'),
+                           ('angle', 'initialAltitudeM', 'descentDistanceM',
+                            'rescueGroundspeed', 'throttleMin', 'throttleMax',
+                            'throttleHover', 'sanityChecks', 'minSats')),
+        'MSP_MOTOR_3D_CONFIG': ('MOTOR_3D_CONFIG', struct.Struct('<3H'),
+                                ('deadband3d_low', 'deadband3d_high', 'neutral')),
+        'MSP_BOARD_ALIGNMENT_CONFIG': ('BOARD_ALIGNMENT_CONFIG', struct.Struct('<3h'),
+                                       ('roll', 'pitch', 'yaw')), # -180 - 360
+    }
+
+    # Messages that are pure acknowledgements: the reply carries no payload
+    # worth parsing, the handler only logs. One table entry each instead of a
+    # one-line method; all of them share _process_ack.
+    _ACK_MESSAGES = {
+        'MSP_SET_RAW_RC': (logging.DEBUG, 'RAW RC values updated'),
+        'MSP_SET_PID': (logging.INFO, 'PID settings saved'),
+        'MSP_SET_RC_TUNING': (logging.INFO, 'RC Tuning saved'),
+        'MSP_ACC_CALIBRATION': (logging.INFO, 'Accel calibration executed'),
+        'MSP_MAG_CALIBRATION': (logging.INFO, 'Mag calibration executed'),
+        'MSP_SET_MOTOR_CONFIG': (logging.INFO, 'Motor Configuration saved'),
+        'MSP_SET_GPS_CONFIG': (logging.INFO, 'GPS Configuration saved'),
+        'MSP_SET_RSSI_CONFIG': (logging.INFO, 'RSSI Configuration saved'),
+        'MSP_SET_FEATURE_CONFIG': (logging.INFO, 'Features saved'),
+        'MSP_SET_BEEPER_CONFIG': (logging.INFO, 'Beeper Configuration saved'),
+        'MSP_RESET_CONF': (logging.INFO, 'Settings Reset'),
+        'MSP_SELECT_SETTING': (logging.INFO, 'Profile selected'),
+        'MSP_SET_SERVO_CONFIGURATION': (logging.INFO, 'Servo Configuration saved'),
+        'MSP_EEPROM_WRITE': (logging.INFO, 'Settings Saved in EEPROM'),
+        'MSP_SET_CURRENT_METER_CONFIG': (logging.INFO, 'Amperage Settings saved'),
+        'MSP_SET_VOLTAGE_METER_CONFIG': (logging.INFO, 'Voltage config saved'),
+        'MSP_SET_MOTOR': (logging.INFO, 'Motor Speeds Updated'),
+        'MSP_SET_ACC_TRIM': (logging.INFO, 'Accelerometer trimms saved.'),
+        'MSP_SET_RX_MAP': (logging.DEBUG, 'RCMAP saved'),
+        'MSP_SET_CF_SERIAL_CONFIG': (logging.INFO, 'Serial config saved'),
+        'MSP_DATAFLASH_ERASE': (logging.INFO, 'Data flash erase begun...'),
+        'MSP_SET_BLACKBOX_CONFIG': (logging.INFO, 'Blackbox config saved'),
+        'MSP_SET_TRANSPONDER_CONFIG': (logging.INFO, 'Transponder config saved'),
+        'MSP_SET_MODE_RANGE': (logging.INFO, 'Mode range saved'),
+        'MSP_SET_ADJUSTMENT_RANGE': (logging.INFO, 'Adjustment range saved'),
+        'MSP_SET_BOARD_ALIGNMENT_CONFIG': (logging.INFO, 'Board alignment saved'),
+        'MSP_SET_PID_CONTROLLER': (logging.INFO, 'PID controller changed'),
+        'MSP_SET_LOOP_TIME': (logging.INFO, 'Looptime saved'),
+        'MSP_SET_ARMING_CONFIG': (logging.INFO, 'Arming config saved'),
+        'MSP_SET_RESET_CURR_PID': (logging.INFO, 'Current PID profile reset'),
+        'MSP_SET_MOTOR_3D_CONFIG': (logging.INFO, '3D settings saved'),
+        'MSP_SET_MIXER_CONFIG': (logging.INFO, 'Mixer config saved'),
+        'MSP_SET_RC_DEADBAND': (logging.INFO, 'Rc controls settings saved'),
+        'MSP_SET_SENSOR_ALIGNMENT': (logging.INFO, 'Sensor alignment saved'),
+        'MSP_SET_RX_CONFIG': (logging.INFO, 'Rx config saved'),
+        'MSP_SET_RXFAIL_CONFIG': (logging.INFO, 'Rxfail config saved'),
+        'MSP_SET_FAILSAFE_CONFIG': (logging.INFO, 'Failsafe config saved'),
+        'MSP_OSD_CONFIG': (logging.INFO, 'OSD_CONFIG received'),
+        'MSP_SET_OSD_CONFIG': (logging.INFO, 'OSD config set'),
+        'MSP_OSD_CHAR_READ': (logging.INFO, 'OSD char received'),
+        'MSP_OSD_CHAR_WRITE': (logging.INFO, 'OSD char uploaded'),
+        'MSP_VTX_CONFIG': (logging.INFO, 'VTX_CONFIG received'),
+        'MSP_SET_VTX_CONFIG': (logging.INFO, 'VTX_CONFIG set'),
+        'MSP_SET_NAME': (logging.INFO, 'Name set'),
+        'MSP_SET_FILTER_CONFIG': (logging.INFO, 'Filter config set'),
+        'MSP_SET_ADVANCED_CONFIG': (logging.INFO, 'Advanced config parameters set'),
+        'MSP_SET_SENSOR_CONFIG': (logging.INFO, 'Sensor config parameters set'),
+        'MSP_COPY_PROFILE': (logging.INFO, 'Copy profile'),
+        # the old stub was named process_MSP_ARMING_DISABLE and thus never
+        # matched this code's MSPCodes2Str name; the table fixes the mapping
+        'MSP_SET_ARMING_DISABLED': (logging.INFO, 'Arming disable'),
+        'MSP_SET_RTC': (logging.INFO, 'Real time clock set'),
+        'MSP_SET_PID_ADVANCED': (logging.INFO, 'Advanced PID settings saved'),
+    }
+
     def __init__(self, device, baudrate=115200, trials=1, 
                  logfilename='MSPy.log', logfilemode='a', loglevel='INFO', timeout=1/100,
                  use_tcp=False, min_time_between_writes = 1/100):
@@ -155,12 +368,45 @@ class MSPy:
 
         self.ser_trials = trials
 
-        self.port_read_lock = RLock()
+        # buffered wrapper around self.read, built once so its rolling
+        # buffer lives and dies with this instance
+        self._buffered_read = msp_ctrl.buffered_reader(self.read)
+
+        # neither receive path re-enters the lock, so a plain Lock is enough
+        # (RLock adds owner-thread bookkeeping on every acquire)
+        self.port_read_lock = Lock()
         self.port_write_lock = Lock()
 
+        # reusable TX buffer (guarded by port_write_lock); big enough for the
+        # largest non-jumbo MSP frame, so the RC/motor hot path never allocates
+        self._tx_buf = bytearray(512)
+
         self.INAV = False
 
-        self.last_write = time.time()
+        self._apiVersionInt = 0 # numeric mirror of CONFIG['apiVersion'], set by process_MSP_API_VERSION
+
+        # function-mask decodes repeat across ports and reconnects; cache them
+        self._serial_function_cache = {}
+
+        # int-keyed dispatch table built once: avoids the per-message
+        # "process_" string concat and class-dict probe in process_recv_data
+        self._processors = {}
+        for code, name in MSPy.MSPCodes2Str.items():
+            processor = getattr(self, 'process_' + name, None)
+            if processor is not None:
+                self._processors[code] = processor
+        for name, spec in MSPy._FIXED_SPECS.items():
+            self._processors[MSPy.MSPCodes[name]] = partial(self._process_fixed, *spec)
+        for name, (level, text) in MSPy._ACK_MESSAGES.items():
+            self._processors[MSPy.MSPCodes[name]] = partial(self._process_ack, level, text)
+
+        # flattened copy of _processors: dispatching a received message is one
+        # list index instead of a dict hash and probe
+        self._handler_table = [None] * (max(self._processors) + 1)
+        for code, processor in self._processors.items():
+            self._handler_table[code] = processor
+
+        self.last_write = time.monotonic() # rate limiting must not jump with NTP clock steps
 
     def __enter__(self):
         is_connection_open = not self.connect(trials=self.ser_trials)
@@ -223,7 +469,9 @@ class MSPy:
             print(f"Waiting for {msg} reply...")
             sent = 0
             while sent<=0:
-                sent = self.send_RAW_msg(MSPy.MSPCodes[msg], data=[])
+                sent = self.send_RAW_msg(MSPy.MSPCodes[msg])
+                if sent<=0:
+                    time.sleep(self.min_time_between_writes) # don't busy-spin on a failing write
             dataHandler = self.receive_msg()
             self.process_recv_data(dataHandler)
 
@@ -232,13 +480,28 @@ class MSPy:
             print(f"Waiting for {msg} reply...")
             sent = 0
             while sent<=0:
-                sent = self.send_RAW_msg(MSPy.MSPCodes[msg], data=[])
+                sent = self.send_RAW_msg(MSPy.MSPCodes[msg])
+                if sent<=0:
+                    time.sleep(self.min_time_between_writes) # don't busy-spin on a failing write
             dataHandler = self.receive_msg()
             self.process_recv_data(dataHandler)
 
         if 'INAV' in self.CONFIG['flightControllerIdentifier']:
             self.INAV = True
 
+        # the firmware type is fixed for the rest of the connection, so bind
+        # the specialized single-struct variants into the dispatch tables
+        if self.INAV:
+            specialized = (('MSP_FILTER_CONFIG', self._process_filter_config_inav),
+                           ('MSP_PID_ADVANCED', self._process_pid_advanced_inav))
+        else:
+            specialized = (('MSP_FILTER_CONFIG', self._process_filter_config_bf),
+                           ('MSP_PID_ADVANCED', self._process_pid_advanced_bf))
+        for name, processor in specialized:
+            code = MSPy.MSPCodes[name]
+            self._processors[code] = processor
+            self._handler_table[code] = processor
+
         basic_info_cmd_list = ['MSP_FC_VERSION', 'MSP_BUILD_INFO', 'MSP_BOARD_INFO', 'MSP_UID', 
                                'MSP_ACC_TRIM', 'MSP_NAME', 'MSP_STATUS', 'MSP_STATUS_EX', 'MSP_ANALOG']
         if self.INAV:
@@ -249,7 +512,9 @@ class MSPy:
         for msg in basic_info_cmd_list:
             sent = 0
             while sent<=0:
-                sent = self.send_RAW_msg(MSPy.MSPCodes[msg], data=[])
+                sent = self.send_RAW_msg(MSPy.MSPCodes[msg])
+                if sent<=0:
+                    time.sleep(self.min_time_between_writes) # don't busy-spin on a failing write
             dataHandler = self.receive_msg()
             self.process_recv_data(dataHandler)
     
@@ -263,9 +528,9 @@ class MSPy:
             # $ + M + < + data_length + msg_code + data + msg_crc
             # 6 bytes + data_length
             data_length = 4
-            msg = self.receive_raw_msg(size = (6+data_length))[5:]
-            converted_msg = struct.unpack('<i', msg[:-1])[0]
-            self.SENSOR_DATA['altitude'] = round((converted_msg / 100.0), 2) # correct scale factor
+            msg = self.receive_raw_msg(size = (6+data_length))
+            converted_msg = _ALTITUDE_STRUCT.unpack_from(msg, 5)[0]
+            self.SENSOR_DATA['altitude'] = round((converted_msg * 0.01), 2) # correct scale factor
 
     def fast_read_imu(self):
         """Request, read and process RAW IMU
@@ -280,26 +545,19 @@ class MSPy:
             # data_length: 9 x 2 = 18 bytes
             data_length = 18
             msg = self.receive_raw_msg(size = (6+data_length))
-            msg = msg[5:]
-            converted_msg = struct.unpack('<%dh' % (data_length/2) , msg[:-1])
+            converted_msg = _IMU_STRUCT.unpack_from(msg, 5)
 
             # /512 for mpu6050, /256 for mma
             # currently we are unable to differentiate between the sensor types, so we are going with 512
             # And what about SENSOR_CONFIG???
-            self.SENSOR_DATA['accelerometer'][0] = converted_msg[0]
-            self.SENSOR_DATA['accelerometer'][1] = converted_msg[1]
-            self.SENSOR_DATA['accelerometer'][2] = converted_msg[2]
+            self.SENSOR_DATA['accelerometer'][:] = converted_msg[0:3]
 
             # properly scaled (INAV and BF use the same * (4 / 16.4))
             # but this is supposed to be RAW, so raw it is!
-            self.SENSOR_DATA['gyroscope'][0] = converted_msg[3]
-            self.SENSOR_DATA['gyroscope'][1] = converted_msg[4]
-            self.SENSOR_DATA['gyroscope'][2] = converted_msg[5]
+            self.SENSOR_DATA['gyroscope'][:] = converted_msg[3:6]
 
             # no clue about scaling factor (/1090), so raw
-            self.SENSOR_DATA['magnetometer'][0] = converted_msg[6]
-            self.SENSOR_DATA['magnetometer'][1] = converted_msg[7]
-            self.SENSOR_DATA['magnetometer'][2] = converted_msg[8]
+            self.SENSOR_DATA['magnetometer'][:] = converted_msg[6:9]
 
 
     def fast_read_attitude(self):
@@ -314,12 +572,13 @@ class MSPy:
             # 6 bytes + data_length
             # data_length: 3 x 2 = 6 bytes
             data_length = 6
-            msg = self.receive_raw_msg(size = (6+data_length))[5:]
-            converted_msg = struct.unpack('<%dh' % (data_length/2) , msg[:-1])
+            msg = self.receive_raw_msg(size = (6+data_length))
+            converted_msg = _ATTITUDE_STRUCT.unpack_from(msg, 5)
 
-            self.SENSOR_DATA['kinematics'][0] = converted_msg[0] / 10.0 # x
-            self.SENSOR_DATA['kinematics'][1] = converted_msg[1] / 10.0 # y
-            self.SENSOR_DATA['kinematics'][2] = converted_msg[2] # z
+            kinematics = self.SENSOR_DATA['kinematics']
+            kinematics[0] = converted_msg[0] / 10.0 # x
+            kinematics[1] = converted_msg[1] / 10.0 # y
+            kinematics[2] = converted_msg[2] # z
     
     
     def fast_read_analog(self):
@@ -335,14 +594,14 @@ class MSPy:
             if not self.INAV:
                 # data_length: 1 + 2 + 2 + 2 + 2 = 9 bytes
                 data_length = 9
-                msg = self.receive_raw_msg(size = (6+data_length))[5:]
-                converted_msg = struct.unpack('<B2HhH', msg[:-1])
+                msg = self.receive_raw_msg(size = (6+data_length))
+                converted_msg = _ANALOG_BF_STRUCT.unpack_from(msg, 5)
 
             else:
                 # data_length: 1 + 2 + 2 + 2 = 7 bytes
                 data_length = 7
-                msg = self.receive_raw_msg(size = (6+data_length))[5:]
-                converted_msg = struct.unpack('<B2Hh', msg[:-1])
+                msg = self.receive_raw_msg(size = (6+data_length))
+                converted_msg = _ANALOG_INAV_STRUCT.unpack_from(msg, 5)
 
             self.ANALOG['voltage'] = converted_msg[0] / 10 # iNAV uses a MSP2 message to get a precise value.
             self.ANALOG['mAhdrawn'] = converted_msg[1]
@@ -363,7 +622,7 @@ class MSPy:
             * The number of values is 4 + number of AUX channels enabled (max 14) 
         """
         cmds = [int(cmd) for cmd in cmds]
-        data = struct.pack('<%dH' % len(cmds), *cmds)
+        data = _u16_struct(len(cmds)).pack(*cmds)
         if self.send_RAW_msg(MSPy.MSPCodes['MSP_SET_RAW_RC'], data):
             # $ + M + < + data_length + msg_code + data + msg_crc
             # 6 bytes + data_length
@@ -374,18 +633,18 @@ class MSPy:
 
         
     def receive_raw_msg(self, size, timeout = 10):
-        current_write = time.time()
-        if (current_write-self.last_write) < self.min_time_between_writes:
-            time.sleep(max(self.min_time_between_writes-(current_write-self.last_write),0))
+        dt = time.monotonic() - self.last_write
+        if dt < self.min_time_between_writes:
+            time.sleep(self.min_time_between_writes - dt)
         with self.port_read_lock:
-            return msp_ctrl.receive_raw_msg(self.read, logging, self.timeout_exception, size, timeout)
+            return msp_ctrl.receive_raw_msg(self._buffered_read, logging, self.timeout_exception, size, timeout)
 
     def receive_msg(self):
-        current_write = time.time()
-        if (current_write-self.last_write) < self.min_time_between_writes:
-            time.sleep(max(self.min_time_between_writes-(current_write-self.last_write),0))
+        dt = time.monotonic() - self.last_write
+        if dt < self.min_time_between_writes:
+            time.sleep(self.min_time_between_writes - dt)
         with self.port_read_lock:
-            return msp_ctrl.receive_msg(self.read, logging)
+            return msp_ctrl.receive_msg(self._buffered_read, logging)
 
 
     @staticmethod
@@ -394,8 +653,8 @@ class MSPy:
 
         Parameters
         ----------
-        data : bytearray
-            Data to be unpacked
+        data : msp_ctrl.MSPDataView
+            Cursor over the data to be unpacked
         size : int, optional
             Number of bits (8, 16 or 32) (default is 8)
         unsigned : bool, optional
@@ -408,74 +667,51 @@ class MSPy:
         int
             unpacked bytes according to input options
         """
-        buffer = bytearray()
-
-        for _ in range(int(size/8)):
-            buffer.append(data.pop(0))
-        
-        if size==8:
-            unpack_format = 'b'
-        elif size==16:
-            if read_as_float: # for special situations like MSP2_INAV_DEBUG
-                unpack_format = 'e'
-            else:   
-                unpack_format = 'h'
-        elif size==32:
-            if read_as_float: # for special situations like MSP2_INAV_DEBUG
-                unpack_format = 'f'
-            else:
-                unpack_format = 'i'
-        else:
+        try:
+            unpacker = _READBYTES_STRUCTS[(size, 'float' if read_as_float else unsigned)]
+        except KeyError:
             raise ValueError('size must be 8, 16 or 32')
-        
-        if unsigned:
-            unpack_format = unpack_format.upper()
 
-        return struct.unpack('<' + unpack_format, buffer)[0]
+        value = unpacker.unpack_from(data.buf, data.pos)[0]
+        data.pos += unpacker.size
+        return value
 
 
     def process_armingDisableFlags(self, flags):
         result = []
+        names = self.armingDisableFlagNames_INAV if self.INAV else self.armingDisableFlagNames_BF
         while (flags):
-            bitpos = ffs(flags) - 1
-            flags &= ~(1 << bitpos)
-            if self.INAV:
-                result.append(self.armingDisableFlagNames_INAV.get(bitpos, ""))
-            else:
-                result.append(self.armingDisableFlagNames_BF.get(bitpos, ""))
+            low = flags & -flags # isolate the lowest set bit
+            result.append(names.get(low.bit_length() - 1, ""))
+            flags ^= low # clear it (cheaper than ~(1 << bitpos))
         return result
 
 
     def process_mode(self, flag):
         """Translate the value from CONFIG['mode']
         """
-        result = []
-        for i in range(len(self.AUX_CONFIG)):
-            if (self.bit_check(flag, i)):
-                result.append(self.AUX_CONFIG[i])
-
-        return result
+        # inline bit test: runs on every status message, so skip the
+        # bit_check call and the modulo it used to do per bit
+        return [name for i, name in enumerate(self.AUX_CONFIG) if flag >> i & 1]
 
 
     @staticmethod
     def bit_check(mask, bit):
-        return ((mask>>bit)%2) != 0
+        return (mask >> bit) & 1 != 0
 
 
     def serialPortFunctionMaskToFunctions(self, functionMask):
-        functions = []
-
-        keys = self.SERIAL_PORT_FUNCTIONS.keys()
-        for key in keys:
-            bit = self.SERIAL_PORT_FUNCTIONS[key]
-            if (self.bit_check(functionMask, bit)):
-                functions.append(key)
-        return functions
+        functions = self._serial_function_cache.get(functionMask)
+        if functions is None:
+            functions = [key for key, bit in self.SERIAL_PORT_FUNCTIONS.items()
+                         if functionMask >> bit & 1]
+            self._serial_function_cache[functionMask] = functions
+        return list(functions) # copy: callers may mutate their port dicts
 
 
     @staticmethod
     def convert(val_list, n=16): 
-        """Convert to n*bits (8 multiple) list
+        """Convert to the little-endian bytes of n-bit values
 
         Parameters
         ----------
@@ -483,29 +719,30 @@ class MSPy:
             List with values to be converted
         
         n: int, optional
-            Number of bits (multiple of 8) (default is 16)
+            Number of bits (8, 16 or 32) (default is 16)
             
         Returns
         -------
-        list
-            List where each item is the equivalent byte value
+        bytes
+            Byte representation of the values
         """ 
-        buffer = []
-        for val in val_list:
-            for i in range(int(n/8)): 
-                buffer.append((int(val)>>i*8) & 255) 
-        return buffer 
+        try:
+            packer = _uint_struct(len(val_list), n)
+        except KeyError:
+            raise ValueError('n must be 8, 16 or 32')
+        mask = (1 << n) - 1 # the old byte-shifting loop truncated silently
+        return packer.pack(*[int(val) & mask for val in val_list])
 
     def save2eprom(self):
         logging.info("Save to EPROM requested") # some configs also need reboot to be applied (not online).
-        return self.send_RAW_msg(MSPy.MSPCodes['MSP_EEPROM_WRITE'], data=[])
+        return self.send_RAW_msg(MSPy.MSPCodes['MSP_EEPROM_WRITE'])
 
 
     def reboot(self):
         logging.info("Reboot requested")
         rebooting = True
         while rebooting:
-            if self.send_RAW_msg(MSPy.MSPCodes['MSP_REBOOT'], data=[]):
+            if self.send_RAW_msg(MSPy.MSPCodes['MSP_REBOOT']):
                 dataHandler = self.receive_msg()
                 if dataHandler['code'] == MSPy.MSPCodes['MSP_REBOOT'] and dataHandler['packet_error'] == 0:
                     rebooting = False
@@ -525,7 +762,7 @@ class MSPy:
         assert(type(new_rc_map)==list)
         assert(len(new_rc_map)==8)
 
-        return self.send_RAW_msg(MSPy.MSPCodes['MSP_SET_RX_MAP'], new_rc_map)
+        return self.send_RAW_msg(MSPy.MSPCodes['MSP_SET_RX_MAP'], bytes(new_rc_map))
 
 
     def set_FEATURE_CONFIG(self, mask):
@@ -561,23 +798,24 @@ class MSPy:
         return self.send_RAW_msg(MSPy.MSPCodes['MSP_SET_RAW_RC'], data)
 
 
-    def send_RAW_msg(self, code, data=[], blocking=None, timeout=None, flush=False):
+    def send_RAW_msg(self, code, data=b'', blocking=None, timeout=None, flush=False):
         mspv = 1 if code <= 255 else 2
-        bufView = msp_ctrl.prepare_RAW_msg(mspv, code, data)
         with self.port_write_lock:
-            current_write = time.time()
+            bufView = msp_ctrl.prepare_RAW_msg(mspv, code, data, self._tx_buf)
+            current_write = time.monotonic()
             if (current_write-self.last_write) < self.min_time_between_writes:
-                time.sleep(max(self.min_time_between_writes-(current_write-self.last_write),0))
+                time.sleep(self.min_time_between_writes-(current_write-self.last_write))
             res = self.write(bufView)
             if flush:
                 self.flush()
             self.last_write = current_write
-            logging.debug("RAW message sent: {}".format(bufView))
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug("RAW message sent: %s", bytes(bufView))
             return res
 
 
     def process_recv_data(self, dataHandler):
-        """Process the dataHandler from receive_msg consuming (pop!) dataHandler['dataView'] as it goes.
+        """Process the dataHandler from receive_msg consuming dataHandler['dataView'] as it goes.
         Based on betaflight-configurator (https://git.io/fjRAV)
 
         Parameters
@@ -591,7 +829,7 @@ class MSPy:
             len(data) when successful or -(error type) if not
         """
 
-        data = dataHandler['dataView'] # DataView (allowing us to view arrayBuffer as struct/union)
+        data = msp_ctrl.MSPDataView(dataHandler['dataView']) # DataView (allowing us to view arrayBuffer as struct/union)
         code = dataHandler['code']
         if code == 0: # code==0 means nothing was received...
             logging.debug("Nothing was received - Code 0")
@@ -604,15 +842,18 @@ class MSPy:
             return -3
         else:
             if (not dataHandler['unsupported']):
-                processor = MSPy.__dict__.get("process_" + MSPy.MSPCodes2Str[code])
+                handler_table = self._handler_table
+                processor = handler_table[code] if code < len(handler_table) else None
                 if processor: # if nothing is found, should be None
                     try:
                         if data:
-                            processor(self,data) # use it..
+                            processor(data) # use it..
                             return len(data)
                         else:
                             return 0 # because a valid message may contain no data...
-                    except IndexError as err:
+                    except (IndexError, struct.error) as err:
+                        # struct.error is the unpack_from equivalent of the old
+                        # pop-driven IndexError: the payload ended early
                         logging.debug('Received data processing error: {}'.format(err))
                         return -4
                 else:
@@ -623,196 +864,199 @@ class MSPy:
                 return -6
         
 
+    def _process_fixed(self, attr, msg_struct, keys, data):
+        target = getattr(self, attr)
+        for key, value in zip(keys, data.unpack(msg_struct)):
+            target[key] = value
+
+    def _process_ack(self, level, text, data):
+        # config uploads can ack in bursts (e.g. writing every mode range);
+        # skip the logging call machinery entirely when the level is filtered
+        if logging.root.isEnabledFor(level):
+            logging.log(level, text)
+
     def process_MSP_STATUS(self, data):
-        self.CONFIG['cycleTime'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['i2cError'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['activeSensors'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['mode'] = self.readbytes(data, size=32, unsigned=True)
-        self.CONFIG['profile'] = self.readbytes(data, size=8, unsigned=True)
+        config = self.CONFIG
+        (config['cycleTime'], config['i2cError'], config['activeSensors'],
+         config['mode'], config['profile']) = data.unpack(_STATUS_STRUCT)
         
     def process_MSP_STATUS_EX(self, data):
-        self.CONFIG['cycleTime'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['i2cError'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['activeSensors'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['mode'] = self.readbytes(data, size=32, unsigned=True)
-
-        self.CONFIG['profile'] = self.readbytes(data, size=8, unsigned=True)
-        self.CONFIG['cpuload'] = self.readbytes(data, size=16, unsigned=True)
+        config = self.CONFIG
+        (config['cycleTime'], config['i2cError'], config['activeSensors'],
+         config['mode'], config['profile'], config['cpuload']) = data.unpack(_STATUS_EX_STRUCT)
         
         if not self.INAV:
-            self.CONFIG['numProfiles'] = self.readbytes(data, size=8, unsigned=True)
-            self.CONFIG['rateProfile'] = self.readbytes(data, size=8, unsigned=True)
+            self.CONFIG['numProfiles'] = data.u8()
+            self.CONFIG['rateProfile'] = data.u8()
 
             # Read flight mode flags
-            byteCount = self.readbytes(data, size=8, unsigned=True)
+            byteCount = data.u8()
             self.CONFIG['flightModeFlags'] = [] # this was not implemented on betaflight-configurator
             for _ in range(byteCount):
                 # betaflight-configurator would just discard these bytes
-                self.CONFIG['flightModeFlags'].append(self.readbytes(data, size=8, unsigned=True))
+                self.CONFIG['flightModeFlags'].append(data.u8())
 
             # Read arming disable flags
-            self.CONFIG['armingDisableCount'] = self.readbytes(data, size=8, unsigned=True) # Flag count
-            self.CONFIG['armingDisableFlags'] = self.readbytes(data, size=32, unsigned=True)
+            self.CONFIG['armingDisableCount'] = data.u8() # Flag count
+            self.CONFIG['armingDisableFlags'] = data.u32()
         else:
-            self.CONFIG['armingDisableFlags'] = self.readbytes(data, size=16, unsigned=True)
+            self.CONFIG['armingDisableFlags'] = data.u16()
 
     def process_MSP2_INAV_STATUS(self, data):
-        self.CONFIG['cycleTime'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['i2cError'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['activeSensors'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['cpuload'] = self.readbytes(data, size=16, unsigned=True)
-        self.CONFIG['profile'] = self.readbytes(data, size=8, unsigned=True)
-        self.CONFIG['armingDisableFlags'] = self.readbytes(data, size=32, unsigned=True)
-        self.CONFIG['mode'] = self.readbytes(data, size=32, unsigned=True)
+        config = self.CONFIG
+        (config['cycleTime'], config['i2cError'], config['activeSensors'],
+         config['cpuload'], config['profile'], config['armingDisableFlags'],
+         config['mode']) = data.unpack(_INAV_STATUS_STRUCT)
         
 
     def process_MSP_RAW_IMU(self, data):
+        values = data.unpack(_IMU_STRUCT)
         # /512 for mpu6050, /256 for mma
         # currently we are unable to differentiate between the sensor types, so we are going with 512
         # And what about SENSOR_CONFIG???
-        self.SENSOR_DATA['accelerometer'][0] = self.readbytes(data, size=16, unsigned=False)
-        self.SENSOR_DATA['accelerometer'][1] = self.readbytes(data, size=16, unsigned=False)
-        self.SENSOR_DATA['accelerometer'][2] = self.readbytes(data, size=16, unsigned=False)
+        self.SENSOR_DATA['accelerometer'][:] = values[0:3]
 
         # properly scaled (INAV and BF use the same * (4 / 16.4))
         # but this is supposed to be RAW, so raw it is!
-        self.SENSOR_DATA['gyroscope'][0] = self.readbytes(data, size=16, unsigned=False)
-        self.SENSOR_DATA['gyroscope'][1] = self.readbytes(data, size=16, unsigned=False)
-        self.SENSOR_DATA['gyroscope'][2] = self.readbytes(data, size=16, unsigned=False)
+        self.SENSOR_DATA['gyroscope'][:] = values[3:6]
 
         # no clue about scaling factor (/1090), so raw
-        self.SENSOR_DATA['magnetometer'][0] = self.readbytes(data, size=16, unsigned=False)
-        self.SENSOR_DATA['magnetometer'][1] = self.readbytes(data, size=16, unsigned=False)
-        self.SENSOR_DATA['magnetometer'][2] = self.readbytes(data, size=16, unsigned=False)
+        self.SENSOR_DATA['magnetometer'][:] = values[6:9]
 
     def process_MSP_SERVO(self, data):
-        servoCount = int(len(data) / 2)
-        self.SERVO_DATA = [self.readbytes(data, size=16, unsigned=True) for _ in range(servoCount)]
+        servoCount = len(data) // 2
+        self.SERVO_DATA = list(_u16_struct(servoCount).unpack_from(data.buf, data.pos))
+        data.pos += servoCount * 2
 
     def process_MSP_MOTOR(self, data):
-        motorCount = int(len(data) / 2)
-        self.MOTOR_DATA = [self.readbytes(data, size=16, unsigned=True) for i in range(motorCount)]
+        motorCount = len(data) // 2
+        self.MOTOR_DATA = list(_u16_struct(motorCount).unpack_from(data.buf, data.pos))
+        data.pos += motorCount * 2
 
     def process_MSP_RC(self, data):
-        n_channels = int(len(data) / 2)
+        n_channels = len(data) // 2
         self.RC['active_channels'] = n_channels
-        self.RC['channels'] = [self.readbytes(data, size=16, unsigned=True) for i in range(n_channels)]
+        self.RC['channels'] = list(_u16_struct(n_channels).unpack_from(data.buf, data.pos))
+        data.pos += n_channels * 2
 
     def process_MSP_RAW_GPS(self, data):
-        self.GPS_DATA['fix'] = self.readbytes(data, size=8, unsigned=True)
-        self.GPS_DATA['numSat'] = self.readbytes(data, size=8, unsigned=True)
-        self.GPS_DATA['lat'] = self.readbytes(data, size=32, unsigned=False)
-        self.GPS_DATA['lon'] = self.readbytes(data, size=32, unsigned=False)
-        self.GPS_DATA['alt'] = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_DATA['speed'] = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_DATA['ground_course'] = self.readbytes(data, size=16, unsigned=True)
+        gps_data = self.GPS_DATA
+        (gps_data['fix'], gps_data['numSat'], gps_data['lat'], gps_data['lon'],
+         gps_data['alt'], gps_data['speed'], gps_data['ground_course']) = data.unpack(_RAW_GPS_STRUCT)
 
         if self.INAV:
-            self.GPS_DATA['hdop'] = self.readbytes(data, size=16, unsigned=True)
+            gps_data['hdop'] = data.u16()
 
     def process_MSP_COMP_GPS(self, data):
-        self.GPS_DATA['distanceToHome'] = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_DATA['directionToHome'] = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_DATA['update'] = self.readbytes(data, size=8, unsigned=True)
+        gps_data = self.GPS_DATA
+        (gps_data['distanceToHome'], gps_data['directionToHome'],
+         gps_data['update']) = data.unpack(_COMP_GPS_STRUCT)
 
     def process_MSP_GPSSTATISTICS(self, data):
-        self.GPS_DATA['messageDt'] = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_DATA['errors'] = self.readbytes(data, size=32, unsigned=True)
-        self.GPS_DATA['timeouts'] = self.readbytes(data, size=32, unsigned=True)
-        self.GPS_DATA['packetCount'] = self.readbytes(data, size=32, unsigned=True)
-        self.GPS_DATA['hdop'] = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_DATA['eph'] = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_DATA['epv'] = self.readbytes(data, size=16, unsigned=True)
+        gps_data = self.GPS_DATA
+        (gps_data['messageDt'], gps_data['errors'], gps_data['timeouts'],
+         gps_data['packetCount'], gps_data['hdop'], gps_data['eph'],
+         gps_data['epv']) = data.unpack(_GPSSTATISTICS_STRUCT)
 
     def process_MSP_ATTITUDE(self, data):
-        self.SENSOR_DATA['kinematics'][0] = self.readbytes(data, size=16, unsigned=False) / 10.0 # x
-        self.SENSOR_DATA['kinematics'][1] = self.readbytes(data, size=16, unsigned=False) / 10.0 # y
-        self.SENSOR_DATA['kinematics'][2] = self.readbytes(data, size=16, unsigned=False) # z
+        x, y, z = data.unpack(_ATTITUDE_STRUCT)
+        kinematics = self.SENSOR_DATA['kinematics']
+        kinematics[0] = x / 10.0
+        kinematics[1] = y / 10.0
+        kinematics[2] = z
 
     def process_MSP_ALTITUDE(self, data):
-        self.SENSOR_DATA['altitude'] = round((self.readbytes(data, size=32, unsigned=False) / 100.0), 2) # correct scale factor
-        self.SENSOR_DATA['altitude_vel'] = round(self.readbytes(data, size=16, unsigned=False) / 100.0, 2)
-        # Baro altitude => self.readbytes(data, size=32, unsigned=True)
+        altitude, altitude_vel = data.unpack(_ALTITUDE_MSG_STRUCT)
+        self.SENSOR_DATA['altitude'] = round((altitude * 0.01), 2) # correct scale factor
+        self.SENSOR_DATA['altitude_vel'] = round(altitude_vel * 0.01, 2)
+        # Baro altitude => the u32 that follows
 
 
     def process_MSP_SONAR(self, data):
-        self.SENSOR_DATA['sonar'] = self.readbytes(data, size=32, unsigned=False)
+        self.SENSOR_DATA['sonar'] = data.unpack(_SONAR_STRUCT)[0]
 
     def process_MSP_ANALOG(self, data):
-        self.ANALOG['voltage'] = self.readbytes(data, size=8, unsigned=True) / 10.0
-        self.ANALOG['mAhdrawn'] = self.readbytes(data, size=16, unsigned=True)
-        self.ANALOG['rssi'] = self.readbytes(data, size=16, unsigned=True) # 0-1023
-        self.ANALOG['amperage'] = self.readbytes(data, size=16, unsigned=False) / 100 # A
-        self.ANALOG['last_received_timestamp'] = int(time.time()) # why not monotonic? where is time synchronized?
+        analog = self.ANALOG
         if not self.INAV:
-            self.ANALOG['voltage'] = self.readbytes(data, size=16, unsigned=True) / 100
+            (analog['voltage'], analog['mAhdrawn'], analog['rssi'],
+             analog['amperage'], voltage) = data.unpack(_ANALOG_BF_MSG_STRUCT)
+            analog['voltage'] = voltage / 100 # BF has a precise 2 bytes value at the end
+        else:
+            (analog['voltage'], analog['mAhdrawn'], analog['rssi'],
+             analog['amperage']) = data.unpack(_ANALOG_INAV_MSG_STRUCT)
+            analog['voltage'] /= 10.0 # iNAV uses a MSP2 message to get a precise value.
+        analog['amperage'] /= 100 # A
+        analog['last_received_timestamp'] = int(time.time()) # why not monotonic? where is time synchronized?
     
     def process_MSP2_INAV_ANALOG(self, data):
         if self.INAV:
-            tmp = self.readbytes(data, size=8, unsigned=True)
-            self.ANALOG['battery_full_when_plugged_in'] = True if (tmp & 1) else False
-            self.ANALOG['use_capacity_thresholds'] = True if ((tmp & 2) >> 1) else False
-            self.ANALOG['battery_state'] = (tmp & 12) >> 2
-            self.ANALOG['cell_count'] = (tmp & 0xF0) >> 4
-
-            self.ANALOG['voltage'] = self.readbytes(data, size=16, unsigned=True) / 100
-            self.ANALOG['amperage'] = self.readbytes(data, size=16, unsigned=True) / 100 # A
-            self.ANALOG['power'] = self.readbytes(data, size=32, unsigned=True) / 100
-            self.ANALOG['mAhdrawn'] = self.readbytes(data, size=32, unsigned=True)
-            self.ANALOG['mWhdrawn'] = self.readbytes(data, size=32, unsigned=True)
-            self.ANALOG['battery_remaining_capacity'] = self.readbytes(data, size=32, unsigned=True)
-            self.ANALOG['battery_percentage'] = self.readbytes(data, size=8, unsigned=True)
-            self.ANALOG['rssi'] = self.readbytes(data, size=16, unsigned=True) # 0-1023
+            tmp = data.u8()
+            self.ANALOG['battery_full_when_plugged_in'] = bool(tmp & 1)
+            self.ANALOG['use_capacity_thresholds'] = bool(tmp & 2)
+            self.ANALOG['battery_state'] = (tmp >> 2) & 3
+            self.ANALOG['cell_count'] = tmp >> 4
+
+            self.ANALOG['voltage'] = data.u16() / 100
+            self.ANALOG['amperage'] = data.u16() / 100 # A
+            self.ANALOG['power'] = data.u32() / 100
+            self.ANALOG['mAhdrawn'] = data.u32()
+            self.ANALOG['mWhdrawn'] = data.u32()
+            self.ANALOG['battery_remaining_capacity'] = data.u32()
+            self.ANALOG['battery_percentage'] = data.u8()
+            self.ANALOG['rssi'] = data.u16() # 0-1023
 
             # TODO: update both BF and INAV variables
             self.BATTERY_STATE['cellCount'] = self.ANALOG['cell_count']
 
     def process_MSP_VOLTAGE_METERS(self, data):
-        total_bytes_per_meter = (8+8)/8 # just to make it clear where it comes from...
-        self.VOLTAGE_METERS = [{'id':self.readbytes(data, size=8, unsigned=True),
-                                'voltage':self.readbytes(data, size=8, unsigned=True) / 10.0
-                                } for _ in range(int(len(data) / total_bytes_per_meter))]
+        end = data.pos + len(data) // _VOLTAGE_METER_STRUCT.size * _VOLTAGE_METER_STRUCT.size
+        self.VOLTAGE_METERS = [{'id': meter_id,
+                                'voltage': voltage / 10.0
+                                } for meter_id, voltage
+                                  in _VOLTAGE_METER_STRUCT.iter_unpack(memoryview(data.buf)[data.pos:end])]
+        data.pos = end
 
     def process_MSP_CURRENT_METERS(self, data):
-        total_bytes_per_meter = (8+16+16)/8 # just to make it clear where it comes from...
-        self.CURRENT_METERS = [{'id':self.readbytes(data, size=8, unsigned=True),
-                                'mAhDrawn':self.readbytes(data, size=16, unsigned=True), # mAh
-                                'amperage':self.readbytes(data, size=16, unsigned=True) / 1000 # A
-                                } for _ in range(int(len(data) / total_bytes_per_meter))]
+        end = data.pos + len(data) // _CURRENT_METER_STRUCT.size * _CURRENT_METER_STRUCT.size
+        self.CURRENT_METERS = [{'id': meter_id,
+                                'mAhDrawn': mah_drawn, # mAh
+                                'amperage': amperage / 1000 # A
+                                } for meter_id, mah_drawn, amperage
+                                  in _CURRENT_METER_STRUCT.iter_unpack(memoryview(data.buf)[data.pos:end])]
+        data.pos = end
 
     def process_MSP_BATTERY_STATE(self, data):
-        self.BATTERY_STATE['cellCount'] = self.readbytes(data, size=8, unsigned=True)
-        self.BATTERY_STATE['capacity'] = self.readbytes(data, size=16, unsigned=True) # mAh
+        battery_state = self.BATTERY_STATE
         # BATTERY_STATE.voltage = data.readU8() / 10.0; // V
-        self.BATTERY_STATE['mAhDrawn'] = self.readbytes(data, size=16, unsigned=True) # mAh
-        self.BATTERY_STATE['amperage'] = self.readbytes(data, size=16, unsigned=True) / 100 # A
-        self.BATTERY_STATE['batteryState'] = self.readbytes(data, size=8, unsigned=True)
-        self.BATTERY_STATE['voltage'] = self.readbytes(data, size=16, unsigned=True) / 100 # V
+        (battery_state['cellCount'], battery_state['capacity'], # mAh
+         battery_state['mAhDrawn'], battery_state['amperage'], # mAh, A
+         battery_state['batteryState'], battery_state['voltage']) = data.unpack(_BATTERY_STATE_STRUCT)
+        battery_state['amperage'] /= 100 # A
+        battery_state['voltage'] /= 100 # V
 
     def process_MSP_VOLTAGE_METER_CONFIG(self, data):
         self.VOLTAGE_METER_CONFIGS = []
         if self.INAV:
             voltageMeterConfig = {}
-            voltageMeterConfig['vbatscale'] = self.readbytes(data, size=8, unsigned=True)/10
+            voltageMeterConfig['vbatscale'] = data.u8()/10
             self.VOLTAGE_METER_CONFIGS.append(voltageMeterConfig)
-            self.BATTERY_CONFIG['vbatmincellvoltage'] = self.readbytes(data, size=8, unsigned=True)/10
-            self.BATTERY_CONFIG['vbatmaxcellvoltage'] = self.readbytes(data, size=8, unsigned=True)/10
-            self.BATTERY_CONFIG['vbatwarningcellvoltage'] = self.readbytes(data, size=8, unsigned=True)/10
+            self.BATTERY_CONFIG['vbatmincellvoltage'] = data.u8()/10
+            self.BATTERY_CONFIG['vbatmaxcellvoltage'] = data.u8()/10
+            self.BATTERY_CONFIG['vbatwarningcellvoltage'] = data.u8()/10
         else:
-            voltage_meter_count = self.readbytes(data, size=8, unsigned=True)
+            voltage_meter_count = data.u8()
 
             for i in range(voltage_meter_count):
-                subframe_length = self.readbytes(data, size=8, unsigned=True)
+                subframe_length = data.u8()
                 if (subframe_length != 5):
-                    for j in range(subframe_length):
-                        self.readbytes(data, size=8, unsigned=True)
+                    data.skip(subframe_length) # unknown subframe type
                 else:
                     voltageMeterConfig = {}
-                    voltageMeterConfig['id'] = self.readbytes(data, size=8, unsigned=True)
-                    voltageMeterConfig['sensorType'] = self.readbytes(data, size=8, unsigned=True)
-                    voltageMeterConfig['vbatscale'] = self.readbytes(data, size=8, unsigned=True)
-                    voltageMeterConfig['vbatresdivval'] = self.readbytes(data, size=8, unsigned=True)
-                    voltageMeterConfig['vbatresdivmultiplier'] = self.readbytes(data, size=8, unsigned=True)
+                    voltageMeterConfig['id'] = data.u8()
+                    voltageMeterConfig['sensorType'] = data.u8()
+                    voltageMeterConfig['vbatscale'] = data.u8()
+                    voltageMeterConfig['vbatresdivval'] = data.u8()
+                    voltageMeterConfig['vbatresdivmultiplier'] = data.u8()
 
                     self.VOLTAGE_METER_CONFIGS.append(voltageMeterConfig)
 
@@ -820,722 +1064,477 @@ class MSPy:
         self.CURRENT_METER_CONFIGS = []
         if self.INAV:
             currentMeterConfig = {}
-            currentMeterConfig['scale'] = self.readbytes(data, size=16, unsigned=True)
-            currentMeterConfig['offset'] = self.readbytes(data, size=16, unsigned=True)
-            currentMeterConfig['sensorType'] = self.readbytes(data, size=8, unsigned=True)
+            currentMeterConfig['scale'] = data.u16()
+            currentMeterConfig['offset'] = data.u16()
+            currentMeterConfig['sensorType'] = data.u8()
             self.CURRENT_METER_CONFIGS.append(currentMeterConfig)
-            self.BATTERY_CONFIG['capacity'] = self.readbytes(data, size=16, unsigned=True)
+            self.BATTERY_CONFIG['capacity'] = data.u16()
         else:
-            current_meter_count = self.readbytes(data, size=8, unsigned=True)
+            current_meter_count = data.u8()
             for i in range(current_meter_count):
                 currentMeterConfig = {}
-                subframe_length = self.readbytes(data, size=8, unsigned=True)
+                subframe_length = data.u8()
 
                 if (subframe_length != 6):
-                    for j in range(subframe_length):
-                        self.readbytes(data, size=8, unsigned=True)
+                    data.skip(subframe_length) # unknown subframe type
                 else:
-                    currentMeterConfig['id'] = self.readbytes(data, size=8, unsigned=True)
-                    currentMeterConfig['sensorType'] = self.readbytes(data, size=8, unsigned=True)
-                    currentMeterConfig['scale'] = self.readbytes(data, size=16, unsigned=False)
-                    currentMeterConfig['offset'] = self.readbytes(data, size=16, unsigned=False)
+                    currentMeterConfig['id'] = data.u8()
+                    currentMeterConfig['sensorType'] = data.u8()
+                    currentMeterConfig['scale'] = data.i16()
+                    currentMeterConfig['offset'] = data.i16()
 
                     self.CURRENT_METER_CONFIGS.append(currentMeterConfig)
 
     def process_MSP_BATTERY_CONFIG(self, data):
-        self.BATTERY_CONFIG['vbatmincellvoltage'] = self.readbytes(data, size=8, unsigned=True) / 10 # 10-50
-        self.BATTERY_CONFIG['vbatmaxcellvoltage'] = self.readbytes(data, size=8, unsigned=True) / 10 # 10-50
-        self.BATTERY_CONFIG['vbatwarningcellvoltage'] = self.readbytes(data, size=8, unsigned=True) / 10 # 10-50
-        self.BATTERY_CONFIG['capacity'] = self.readbytes(data, size=16, unsigned=True)
-        self.BATTERY_CONFIG['voltageMeterSource'] = self.readbytes(data, size=8, unsigned=True)
-        self.BATTERY_CONFIG['currentMeterSource'] = self.readbytes(data, size=8, unsigned=True)
+        self.BATTERY_CONFIG['vbatmincellvoltage'] = data.u8() / 10 # 10-50
+        self.BATTERY_CONFIG['vbatmaxcellvoltage'] = data.u8() / 10 # 10-50
+        self.BATTERY_CONFIG['vbatwarningcellvoltage'] = data.u8() / 10 # 10-50
+        self.BATTERY_CONFIG['capacity'] = data.u16()
+        self.BATTERY_CONFIG['voltageMeterSource'] = data.u8()
+        self.BATTERY_CONFIG['currentMeterSource'] = data.u8()
 
-        self.BATTERY_CONFIG['vbatmincellvoltage'] = self.readbytes(data, size=16, unsigned=True) / 100
-        self.BATTERY_CONFIG['vbatmaxcellvoltage'] = self.readbytes(data, size=16, unsigned=True) / 100
-        self.BATTERY_CONFIG['vbatwarningcellvoltage'] = self.readbytes(data, size=16, unsigned=True) / 100
+        self.BATTERY_CONFIG['vbatmincellvoltage'] = data.u16() / 100
+        self.BATTERY_CONFIG['vbatmaxcellvoltage'] = data.u16() / 100
+        self.BATTERY_CONFIG['vbatwarningcellvoltage'] = data.u16() / 100
 
     def process_MSP_RC_TUNING(self, data):
-        self.RC_TUNING['RC_RATE'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
-        self.RC_TUNING['RC_EXPO'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
+        self.RC_TUNING['RC_RATE'] = round((data.u8() * 0.01), 2)
+        self.RC_TUNING['RC_EXPO'] = round((data.u8() * 0.01), 2)
 
         self.RC_TUNING['roll_pitch_rate'] = 0
-        self.RC_TUNING['roll_rate'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
-        self.RC_TUNING['pitch_rate'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
+        self.RC_TUNING['roll_rate'] = round((data.u8() * 0.01), 2)
+        self.RC_TUNING['pitch_rate'] = round((data.u8() * 0.01), 2)
 
-        self.RC_TUNING['yaw_rate'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
-        self.RC_TUNING['dynamic_THR_PID'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
-        self.RC_TUNING['throttle_MID'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
-        self.RC_TUNING['throttle_EXPO'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
+        self.RC_TUNING['yaw_rate'] = round((data.u8() * 0.01), 2)
+        self.RC_TUNING['dynamic_THR_PID'] = round((data.u8() * 0.01), 2)
+        self.RC_TUNING['throttle_MID'] = round((data.u8() * 0.01), 2)
+        self.RC_TUNING['throttle_EXPO'] = round((data.u8() * 0.01), 2)
 
-        self.RC_TUNING['dynamic_THR_breakpoint'] = self.readbytes(data, size=16, unsigned=True)
+        self.RC_TUNING['dynamic_THR_breakpoint'] = data.u16()
 
-        self.RC_TUNING['RC_YAW_EXPO'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
+        self.RC_TUNING['RC_YAW_EXPO'] = round((data.u8() * 0.01), 2)
 
         if not self.INAV:
-            self.RC_TUNING['rcYawRate'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
+            self.RC_TUNING['rcYawRate'] = round((data.u8() * 0.01), 2)
 
-            self.RC_TUNING['rcPitchRate'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
-            self.RC_TUNING['RC_PITCH_EXPO'] = round((self.readbytes(data, size=8, unsigned=True) / 100.0), 2)
+            self.RC_TUNING['rcPitchRate'] = round((data.u8() * 0.01), 2)
+            self.RC_TUNING['RC_PITCH_EXPO'] = round((data.u8() * 0.01), 2)
 
-            self.RC_TUNING['throttleLimitType'] = self.readbytes(data, size=8, unsigned=True)
-            self.RC_TUNING['throttleLimitPercent'] = self.readbytes(data, size=8, unsigned=True)
+            self.RC_TUNING['throttleLimitType'] = data.u8()
+            self.RC_TUNING['throttleLimitPercent'] = data.u8()
 
-            if int("".join((self.CONFIG['apiVersion'].rsplit('.')))) >= 1420:
-                self.RC_TUNING['roll_rate_limit'] = self.readbytes(data, size=16, unsigned=True)
-                self.RC_TUNING['pitch_rate_limit'] = self.readbytes(data, size=16, unsigned=True)
-                self.RC_TUNING['yaw_rate_limit'] = self.readbytes(data, size=16, unsigned=True)
+            if self._apiVersionInt >= 1420:
+                self.RC_TUNING['roll_rate_limit'] = data.u16()
+                self.RC_TUNING['pitch_rate_limit'] = data.u16()
+                self.RC_TUNING['yaw_rate_limit'] = data.u16()
 
     def process_MSP_PID(self, data):
-        self.PIDs = [
-            [
-                self.readbytes(data, size=8, unsigned=True) for _ in range(3)
-            ] 
-            for _ in range(int(len(data)/3))
-        ]
+        # one copy of the payload, then slice it into rows of P, I, D bytes
+        raw = data.read(len(data) - len(data) % 3)
+        self.PIDs = [list(raw[i:i + 3]) for i in range(0, len(raw), 3)]
 
     def process_MSP2_PID(self, data):
-        self.PIDs = [
-            [
-                self.readbytes(data, size=8, unsigned=True) for _ in range(4)
-            ] 
-            for _ in range(int(len(data)/4))
-        ]
+        # same as above with a feed-forward byte per row
+        raw = data.read(len(data) - len(data) % 4)
+        self.PIDs = [list(raw[i:i + 4]) for i in range(0, len(raw), 4)]
 
     def process_MSP_ARMING_CONFIG(self, data):
-        self.ARMING_CONFIG['auto_disarm_delay'] = self.readbytes(data, size=8, unsigned=True)
-        self.ARMING_CONFIG['disarm_kill_switch'] = self.readbytes(data, size=8, unsigned=True)
+        self.ARMING_CONFIG['auto_disarm_delay'] = data.u8()
+        self.ARMING_CONFIG['disarm_kill_switch'] = data.u8()
         if not self.INAV:
-            self.ARMING_CONFIG['small_angle'] = self.readbytes(data, size=8, unsigned=True)
+            self.ARMING_CONFIG['small_angle'] = data.u8()
 
     def process_MSP_LOOP_TIME(self, data):
         if self.INAV:
-            self.FC_CONFIG['loopTime'] = self.readbytes(data, size=16, unsigned=True)
+            self.FC_CONFIG['loopTime'] = data.u16()
 
     def process_MSP_MISC(self, data): # 22 bytes
         if self.INAV:
-            self.MISC['midrc'] = self.RX_CONFIG['midrc'] = self.readbytes(data, size=16, unsigned=True)
-            self.MISC['minthrottle'] = self.MOTOR_CONFIG['minthrottle'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-            self.MISC['maxthrottle'] = self.MOTOR_CONFIG['maxthrottle'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-            self.MISC['mincommand'] = self.MOTOR_CONFIG['mincommand'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-            self.MISC['failsafe_throttle'] = self.readbytes(data, size=16, unsigned=True) # 1000-2000
-            self.MISC['gps_type'] = self.GPS_CONFIG['provider'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['sensors_baudrate'] = self.MISC['gps_baudrate'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['gps_ubx_sbas'] = self.GPS_CONFIG['ublox_sbas'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['multiwiicurrentoutput'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['rssi_channel'] = self.RSSI_CONFIG['channel'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['placeholder2'] = self.readbytes(data, size=8, unsigned=True)
-
-            self.COMPASS_CONFIG['mag_declination'] = self.readbytes(data, size=16, unsigned=False) / 100 # -18000-18000
-            
-            self.MISC['mag_declination'] = self.COMPASS_CONFIG['mag_declination']*10
-
-            self.MISC['vbatscale'] = self.readbytes(data, size=8, unsigned=True) # 10-200
-            self.MISC['vbatmincellvoltage'] = self.readbytes(data, size=8, unsigned=True) / 10 # 10-50
-            self.MISC['vbatmaxcellvoltage'] = self.readbytes(data, size=8, unsigned=True) / 10 # 10-50
-            self.MISC['vbatwarningcellvoltage'] = self.readbytes(data, size=8, unsigned=True) / 10 # 10-50
+            misc = self.MISC
+            (misc['midrc'], misc['minthrottle'], misc['maxthrottle'], # 0-2000
+             misc['mincommand'], misc['failsafe_throttle'], # 0-2000, 1000-2000
+             misc['gps_type'], misc['sensors_baudrate'], misc['gps_ubx_sbas'],
+             misc['multiwiicurrentoutput'], misc['rssi_channel'], misc['placeholder2'],
+             mag_declination, # -18000-18000
+             misc['vbatscale'], # 10-200
+             vbatmincellvoltage, vbatmaxcellvoltage, # 10-50
+             vbatwarningcellvoltage) = data.unpack(_MISC_STRUCT) # 10-50
+
+            self.RX_CONFIG['midrc'] = misc['midrc']
+            self.MOTOR_CONFIG['minthrottle'] = misc['minthrottle']
+            self.MOTOR_CONFIG['maxthrottle'] = misc['maxthrottle']
+            self.MOTOR_CONFIG['mincommand'] = misc['mincommand']
+            self.GPS_CONFIG['provider'] = misc['gps_type']
+            misc['gps_baudrate'] = misc['sensors_baudrate']
+            self.GPS_CONFIG['ublox_sbas'] = misc['gps_ubx_sbas']
+            self.RSSI_CONFIG['channel'] = misc['rssi_channel']
+
+            self.COMPASS_CONFIG['mag_declination'] = mag_declination / 100
+            misc['mag_declination'] = self.COMPASS_CONFIG['mag_declination']*10
+
+            misc['vbatmincellvoltage'] = vbatmincellvoltage / 10
+            misc['vbatmaxcellvoltage'] = vbatmaxcellvoltage / 10
+            misc['vbatwarningcellvoltage'] = vbatwarningcellvoltage / 10
 
     def process_MSP2_INAV_MISC(self, data):
         if self.INAV:
-            self.MISC['midrc'] = self.RX_CONFIG['midrc'] = self.readbytes(data, size=16, unsigned=True)
-            self.MISC['minthrottle'] = self.MOTOR_CONFIG['minthrottle'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-            self.MISC['maxthrottle'] = self.MOTOR_CONFIG['maxthrottle'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-            self.MISC['mincommand'] = self.MOTOR_CONFIG['mincommand'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-            self.MISC['failsafe_throttle'] = self.readbytes(data, size=16, unsigned=True) # 1000-2000
-            self.MISC['gps_type'] = self.GPS_CONFIG['provider'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['sensors_baudrate'] = self.MISC['gps_baudrate'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['gps_ubx_sbas'] = self.GPS_CONFIG['ublox_sbas'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['rssi_channel'] = self.RSSI_CONFIG['channel'] = self.readbytes(data, size=8, unsigned=True)
-
-            self.MISC['mag_declination'] = self.readbytes(data, size=16, unsigned=False) / 10 # -18000-18000
-            self.MISC['vbatscale'] = self.readbytes(data, size=16, unsigned=True)
-            self.MISC['voltage_source'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['battery_cells'] = self.readbytes(data, size=8, unsigned=True)
-            self.MISC['vbatdetectcellvoltage'] = self.readbytes(data, size=16, unsigned=True) / 100
-            self.MISC['vbatmincellvoltage'] = self.readbytes(data, size=16, unsigned=True) / 100
-            self.MISC['vbatmaxcellvoltage'] = self.readbytes(data, size=16, unsigned=True) / 100
-            self.MISC['vbatwarningcellvoltage'] = self.readbytes(data, size=16, unsigned=True) / 100
-            self.MISC['battery_capacity'] = self.readbytes(data, size=32, unsigned=True)
-            self.MISC['battery_capacity_warning'] = self.readbytes(data, size=32, unsigned=True)
-            self.MISC['battery_capacity_critical'] = self.readbytes(data, size=32, unsigned=True)
-            self.MISC['battery_capacity_unit'] = 'mWh' if self.readbytes(data, size=8, unsigned=True) else 'mAh'
+            misc = self.MISC
+            (misc['midrc'], misc['minthrottle'], misc['maxthrottle'], # 0-2000
+             misc['mincommand'], misc['failsafe_throttle'], # 0-2000, 1000-2000
+             misc['gps_type'], misc['sensors_baudrate'], misc['gps_ubx_sbas'],
+             misc['rssi_channel'],
+             mag_declination, # -18000-18000
+             misc['vbatscale'], misc['voltage_source'], misc['battery_cells'],
+             vbatdetectcellvoltage, vbatmincellvoltage,
+             vbatmaxcellvoltage, vbatwarningcellvoltage,
+             misc['battery_capacity'], misc['battery_capacity_warning'],
+             misc['battery_capacity_critical'],
+             battery_capacity_unit) = data.unpack(_INAV_MISC_STRUCT)
+
+            self.RX_CONFIG['midrc'] = misc['midrc']
+            self.MOTOR_CONFIG['minthrottle'] = misc['minthrottle']
+            self.MOTOR_CONFIG['maxthrottle'] = misc['maxthrottle']
+            self.MOTOR_CONFIG['mincommand'] = misc['mincommand']
+            self.GPS_CONFIG['provider'] = misc['gps_type']
+            misc['gps_baudrate'] = misc['sensors_baudrate']
+            self.GPS_CONFIG['ublox_sbas'] = misc['gps_ubx_sbas']
+            self.RSSI_CONFIG['channel'] = misc['rssi_channel']
+
+            misc['mag_declination'] = mag_declination / 10
+            misc['vbatdetectcellvoltage'] = vbatdetectcellvoltage / 100
+            misc['vbatmincellvoltage'] = vbatmincellvoltage / 100
+            misc['vbatmaxcellvoltage'] = vbatmaxcellvoltage / 100
+            misc['vbatwarningcellvoltage'] = vbatwarningcellvoltage / 100
+            misc['battery_capacity_unit'] = 'mWh' if battery_capacity_unit else 'mAh'
 
     def process_MSP_MOTOR_CONFIG(self, data):
-        self.MOTOR_CONFIG['minthrottle'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-        self.MOTOR_CONFIG['maxthrottle'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-        self.MOTOR_CONFIG['mincommand'] = self.readbytes(data, size=16, unsigned=True) # 0-2000
-
-        self.MOTOR_CONFIG['motor_count'] = self.readbytes(data, size=8, unsigned=True)
-        self.MOTOR_CONFIG['motor_poles'] = self.readbytes(data, size=8, unsigned=True)
-        self.MOTOR_CONFIG['use_dshot_telemetry'] = (self.readbytes(data, size=8, unsigned=True) != 0)
-        self.MOTOR_CONFIG['use_esc_sensor'] = (self.readbytes(data, size=8, unsigned=True) != 0)
+        motor_config = self.MOTOR_CONFIG
+        (motor_config['minthrottle'], motor_config['maxthrottle'], # 0-2000
+         motor_config['mincommand'], # 0-2000
+         motor_config['motor_count'], motor_config['motor_poles'],
+         use_dshot_telemetry, use_esc_sensor) = data.unpack(_MOTOR_CONFIG_STRUCT)
+        motor_config['use_dshot_telemetry'] = (use_dshot_telemetry != 0)
+        motor_config['use_esc_sensor'] = (use_esc_sensor != 0)
 
     def process_MSP_COMPASS_CONFIG(self, data):
-        self.COMPASS_CONFIG['mag_declination'] = self.readbytes(data, size=16, unsigned=False) / 100 # -18000-18000
-
-    def process_MSP_GPS_CONFIG(self, data):
-        self.GPS_CONFIG['provider'] = self.readbytes(data, size=8, unsigned=True)
-        self.GPS_CONFIG['ublox_sbas'] = self.readbytes(data, size=8, unsigned=True)
-        
-        self.GPS_CONFIG['auto_config'] = self.readbytes(data, size=8, unsigned=True)
-        self.GPS_CONFIG['auto_baud'] = self.readbytes(data, size=8, unsigned=True)
-
-    def process_MSP_GPS_RESCUE(self, data):
-        self.GPS_RESCUE['angle']             = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_RESCUE['initialAltitudeM']  = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_RESCUE['descentDistanceM']  = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_RESCUE['rescueGroundspeed'] = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_RESCUE['throttleMin']       = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_RESCUE['throttleMax']       = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_RESCUE['throttleHover']     = self.readbytes(data, size=16, unsigned=True)
-        self.GPS_RESCUE['sanityChecks']      = self.readbytes(data, size=8, unsigned=True)
-        self.GPS_RESCUE['minSats']           = self.readbytes(data, size=8, unsigned=True)
-
-    def process_MSP_RSSI_CONFIG(self, data):
-        self.RSSI_CONFIG['channel'] = self.readbytes(data, size=8, unsigned=True)
-
-    def process_MSP_MOTOR_3D_CONFIG(self, data):
-        self.MOTOR_3D_CONFIG['deadband3d_low'] = self.readbytes(data, size=16, unsigned=True)
-        self.MOTOR_3D_CONFIG['deadband3d_high'] = self.readbytes(data, size=16, unsigned=True)
-        self.MOTOR_3D_CONFIG['neutral'] = self.readbytes(data, size=16, unsigned=True)
+        self.COMPASS_CONFIG['mag_declination'] = data.i16() / 100 # -18000-18000
 
     def process_MSP_BOXNAMES(self, data):
-        self.AUX_CONFIG = [] # empty the array as new data is coming in
-
-        buff = ""
-        for i in range(len(data)):
-            char = self.readbytes(data, size=8, unsigned=True)
-            if (char == 0x3B): # ; (delimeter char)
-                self.AUX_CONFIG.append(buff) # convert bytes into ASCII and save as strings
-
-                # empty buffer
-                buff = ""
-            else:
-                buff += chr(char)
+        # the names come as one ';' delimited blob; a partial trailing name
+        # (no delimiter) is discarded, as the old char-by-char loop did
+        names = data.read(len(data)).split(b';')[:-1]
+        self.AUX_CONFIG = [name.decode('latin1') for name in names] # latin1 == chr()
 
     def process_MSP_PIDNAMES(self, data):
-        self.PIDNAMES = [] # empty the array as new data is coming in
-
-        buff = ""
-        for i in range(len(data)):
-            char = self.readbytes(data, size=8, unsigned=True)
-            if (char == 0x3B):  # ; (delimeter char)
-                self.PIDNAMES.append(buff) # convert bytes into ASCII and save as strings
-
-                # empty buffer
-                buff = ""
-            else:
-                buff += chr(char)
+        names = data.read(len(data)).split(b';')[:-1]
+        self.PIDNAMES = [name.decode('latin1') for name in names]
 
     def process_MSP_BOXIDS(self, data):
-        self.AUX_CONFIG_IDS = [] # empty the array as new data is coming in
-
-        for i in range(len(data)):
-            self.AUX_CONFIG_IDS.append(self.readbytes(data, size=8, unsigned=True))
+        # one C-level conversion; iterating bytes yields ints already
+        self.AUX_CONFIG_IDS = list(data.read(len(data)))
 
     def process_MSP_SERVO_CONFIGURATIONS(self, data):
         self.SERVO_CONFIG = [] # empty the array as new data is coming in
-        if (len(data) % 12 == 0):
-            for i in range(0, len(data), 12):
-                arr = {
-                    'min':                      self.readbytes(data, size=16, unsigned=True),
-                    'max':                      self.readbytes(data, size=16, unsigned=True),
-                    'middle':                   self.readbytes(data, size=16, unsigned=True),
-                    'rate':                     self.readbytes(data, size=8, unsigned=False),
-                    'indexOfChannelToForward':  self.readbytes(data, size=8, unsigned=True),
-                    'reversedInputSources':     self.readbytes(data, size=32, unsigned=True)
-                }
-
-                self.SERVO_CONFIG.append(arr)
-
-    def process_MSP_RC_DEADBAND(self, data):
-        self.RC_DEADBAND_CONFIG['deadband'] = self.readbytes(data, size=8, unsigned=True)
-        self.RC_DEADBAND_CONFIG['yaw_deadband'] = self.readbytes(data, size=8, unsigned=True)
-        self.RC_DEADBAND_CONFIG['alt_hold_deadband'] = self.readbytes(data, size=8, unsigned=True)
-
-        self.RC_DEADBAND_CONFIG['deadband3d_throttle'] = self.readbytes(data, size=16, unsigned=True)
+        if (len(data) % _SERVO_CONFIG_STRUCT.size == 0):
+            end = data.pos + len(data)
+            self.SERVO_CONFIG = [
+                {
+                    'min':                      values[0],
+                    'max':                      values[1],
+                    'middle':                   values[2],
+                    'rate':                     values[3], # signed
+                    'indexOfChannelToForward':  values[4],
+                    'reversedInputSources':     values[5]
+                } for values in _SERVO_CONFIG_STRUCT.iter_unpack(memoryview(data.buf)[data.pos:end])]
+            data.pos = end
 
     def process_MSP_SENSOR_ALIGNMENT(self, data):
-        self.SENSOR_ALIGNMENT['align_gyro'] = self.readbytes(data, size=8, unsigned=True)
-        self.SENSOR_ALIGNMENT['align_acc'] = self.readbytes(data, size=8, unsigned=True)
-        self.SENSOR_ALIGNMENT['align_mag'] = self.readbytes(data, size=8, unsigned=True)
+        self.SENSOR_ALIGNMENT['align_gyro'] = data.u8()
+        self.SENSOR_ALIGNMENT['align_acc'] = data.u8()
+        self.SENSOR_ALIGNMENT['align_mag'] = data.u8()
 
         if self.INAV:
-            self.SENSOR_ALIGNMENT['align_opflow'] = self.readbytes(data, size=8, unsigned=True)
+            self.SENSOR_ALIGNMENT['align_opflow'] = data.u8()
         else:
-            self.SENSOR_ALIGNMENT['gyro_detection_flags'] = self.readbytes(data, size=8, unsigned=True)
-            self.SENSOR_ALIGNMENT['gyro_to_use'] = self.readbytes(data, size=8, unsigned=True)
-            self.SENSOR_ALIGNMENT['gyro_1_align'] = self.readbytes(data, size=8, unsigned=True)
-            self.SENSOR_ALIGNMENT['gyro_2_align'] = self.readbytes(data, size=8, unsigned=True)
+            self.SENSOR_ALIGNMENT['gyro_detection_flags'] = data.u8()
+            self.SENSOR_ALIGNMENT['gyro_to_use'] = data.u8()
+            self.SENSOR_ALIGNMENT['gyro_1_align'] = data.u8()
+            self.SENSOR_ALIGNMENT['gyro_2_align'] = data.u8()
 
     # def process_MSP_DISPLAYPORT(self, data):
 
-    def process_MSP_SET_RAW_RC(self, data):
-        logging.debug('RAW RC values updated')
-
-    def process_MSP_SET_PID(self, data):
-        logging.info('PID settings saved')
-
-    def process_MSP_SET_RC_TUNING(self, data):
-        logging.info('RC Tuning saved')
-
-    def process_MSP_ACC_CALIBRATION(self, data):
-        logging.info('Accel calibration executed')
-
-    def process_MSP_MAG_CALIBRATION(self, data):
-        logging.info('Mag calibration executed')
-
-    def process_MSP_SET_MOTOR_CONFIG(self, data):
-        logging.info('Motor Configuration saved')
-
-    def process_MSP_SET_GPS_CONFIG(self, data):
-        logging.info('GPS Configuration saved')
-
-    def process_MSP_SET_RSSI_CONFIG(self, data):
-        logging.info('RSSI Configuration saved')
-
-    def process_MSP_SET_FEATURE_CONFIG(self, data):
-        logging.info('Features saved')
-
-    def process_MSP_SET_BEEPER_CONFIG(self, data):
-        logging.info('Beeper Configuration saved')
-
-    def process_MSP_RESET_CONF(self, data):
-        logging.info('Settings Reset')
-
-    def process_MSP_SELECT_SETTING(self, data):
-        logging.info('Profile selected')
-
-    def process_MSP_SET_SERVO_CONFIGURATION(self, data):
-        logging.info('Servo Configuration saved')
-
-    def process_MSP_EEPROM_WRITE(self, data):
-        logging.info('Settings Saved in EEPROM')
-
-    def process_MSP_SET_CURRENT_METER_CONFIG(self, data):
-        logging.info('Amperage Settings saved')
-
-    def process_MSP_SET_VOLTAGE_METER_CONFIG(self, data):
-        logging.info('Voltage config saved')
         
     def process_MSP_DEBUG(self, data):
-        for i in range(4):
-            self.SENSOR_DATA['debug'][i] = self.readbytes(data, size=16, unsigned=False)
+        self.SENSOR_DATA['debug'][:4] = data.unpack(_DEBUG_STRUCT)
 
     def process_MSP2_INAV_DEBUG(self, data):
-        for i in range(8):
-            self.SENSOR_DATA['debug'][i] = self.readbytes(data, size=32, unsigned=False)
-
-    def process_MSP_SET_MOTOR(self, data):
-        logging.info('Motor Speeds Updated')
+        self.SENSOR_DATA['debug'][:8] = data.unpack(_INAV_DEBUG_STRUCT)
 
     def process_MSP_UID(self, data):
-        for i in range(3):
-            self.CONFIG['uid'][i] = self.readbytes(data, size=32, unsigned=True)
+        self.CONFIG['uid'][:] = data.unpack(_UID_STRUCT)
     
     def process_MSP_ACC_TRIM(self, data):
-        self.CONFIG['accelerometerTrims'][0] = self.readbytes(data, size=16, unsigned=False) # pitch
-        self.CONFIG['accelerometerTrims'][1] = self.readbytes(data, size=16, unsigned=False) # roll
-
-    def process_MSP_SET_ACC_TRIM(self, data):
-        logging.info('Accelerometer trimms saved.')
+        # pitch, roll
+        self.CONFIG['accelerometerTrims'][:] = data.unpack(_ACC_TRIM_STRUCT)
 
     def process_MSP_GPS_SV_INFO(self, data):
         if (len(data) > 0):
-            numCh = self.readbytes(data, size=8, unsigned=True)
+            numCh = data.u8()
 
-            for i in range(numCh):
-                self.GPS_DATA['chn'].append(self.readbytes(data, size=8, unsigned=True))
-                self.GPS_DATA['svid'].append(self.readbytes(data, size=8, unsigned=True))
-                self.GPS_DATA['quality'].append(self.readbytes(data, size=8, unsigned=True))
-                self.GPS_DATA['cno'].append(self.readbytes(data, size=8, unsigned=True))
+            # 4 bytes per channel; a strided slice pulls out each column in C
+            records = data.read(4 * numCh)
+            gps_data = self.GPS_DATA
+            gps_data['chn'].extend(records[0::4])
+            gps_data['svid'].extend(records[1::4])
+            gps_data['quality'].extend(records[2::4])
+            gps_data['cno'].extend(records[3::4])
 
     def process_MSP_RX_MAP(self, data):
-        self.RC_MAP = [] # empty the array as new data is coming in
-
-        for i in range(len(data)):
-            self.RC_MAP.append(self.readbytes(data, size=8, unsigned=True))
+        self.RC_MAP = list(data.read(len(data)))
 
-    def process_MSP_SET_RX_MAP(self, data):
-        logging.debug('RCMAP saved')
         
     def process_MSP_MIXER_CONFIG(self, data):
-        self.MIXER_CONFIG['mixer'] = self.readbytes(data, size=8, unsigned=True)
+        self.MIXER_CONFIG['mixer'] = data.u8()
         if not self.INAV:                    
-            self.MIXER_CONFIG['reverseMotorDir'] = self.readbytes(data, size=8, unsigned=True)
+            self.MIXER_CONFIG['reverseMotorDir'] = data.u8()
 
     def process_MSP_FEATURE_CONFIG(self, data):
-        self.FEATURE_CONFIG['featuremask']  = self.readbytes(data, size=32, unsigned=True)
+        featuremask = data.u32()
+        self.FEATURE_CONFIG['featuremask'] = featuremask
+        features = self.FEATURE_CONFIG['features']
         for idx in range(32):
-            enabled = self.bit_check(self.FEATURE_CONFIG['featuremask'], idx)
-            if idx in self.FEATURE_CONFIG['features'].keys():
-                self.FEATURE_CONFIG['features'][idx]['enabled'] = enabled
-            else:
-                self.FEATURE_CONFIG['features'][idx] = {'enabled': enabled}
+            # bit_check inlined: no method call in the innermost loop
+            features.setdefault(idx, {})['enabled'] = (featuremask >> idx & 1) != 0
 
     def process_MSP_BEEPER_CONFIG(self, data):
-        self.BEEPER_CONFIG['beepers'] = self.readbytes(data, size=32, unsigned=True)
+        self.BEEPER_CONFIG['beepers'] = data.u32()
             
-        self.BEEPER_CONFIG['dshotBeaconTone'] = self.readbytes(data, size=8, unsigned=True)
-
-        self.BEEPER_CONFIG['dshotBeaconConditions'] = self.readbytes(data, size=32, unsigned=True)
+        self.BEEPER_CONFIG['dshotBeaconTone'] = data.u8()
 
-    def process_MSP_BOARD_ALIGNMENT_CONFIG(self, data):
-        self.BOARD_ALIGNMENT_CONFIG['roll'] = self.readbytes(data, size=16, unsigned=False) # -180 - 360
-        self.BOARD_ALIGNMENT_CONFIG['pitch'] = self.readbytes(data, size=16, unsigned=False) # -180 - 360
-        self.BOARD_ALIGNMENT_CONFIG['yaw'] = self.readbytes(data, size=16, unsigned=False) # -180 - 360
+        self.BEEPER_CONFIG['dshotBeaconConditions'] = data.u32()
 
     def process_MSP_SET_REBOOT(self, data):
-        rebootType = self.readbytes(data, size=8, unsigned=True)
+        rebootType = data.u8()
 
         if ((rebootType == self.REBOOT_TYPES['MSC']) or (rebootType == self.REBOOT_TYPES['MSC_UTC'])):
-            if (self.readbytes(data, size=8, unsigned=True) == 0):
+            if (data.u8() == 0):
                 logging.warning('Storage device not ready for reboot.')
 
         logging.info('Reboot request accepted')
 
     def process_MSP_API_VERSION(self, data):
-        self.CONFIG['mspProtocolVersion'] = self.readbytes(data, size=8, unsigned=True)
-        self.CONFIG['apiVersion'] = str(self.readbytes(data, size=8, unsigned=True)) + '.' + str(self.readbytes(data, size=8, unsigned=True)) + '.0'
+        self.CONFIG['mspProtocolVersion'] = data.u8()
+        major = data.u8()
+        minor = data.u8()
+        self.CONFIG['apiVersion'] = str(major) + '.' + str(minor) + '.0'
+        # comparable form, e.g. 1.42.0 -> 1420, cached for the hot parsers
+        self._apiVersionInt = major * 1000 + minor * 10
 
     def process_MSP_FC_VARIANT(self, data):
-        identifier = ''
-        for i in range(4):
-            identifier += chr(self.readbytes(data, size=8, unsigned=True))
-        self.CONFIG['flightControllerIdentifier'] = identifier
+        self.CONFIG['flightControllerIdentifier'] = data.read(4).decode('latin1')
 
     def process_MSP_FC_VERSION(self, data):
-        self.CONFIG['flightControllerVersion'] =  str(self.readbytes(data, size=8, unsigned=True)) + '.'
-        self.CONFIG['flightControllerVersion'] += str(self.readbytes(data, size=8, unsigned=True)) + '.'
-        self.CONFIG['flightControllerVersion'] += str(self.readbytes(data, size=8, unsigned=True))
+        self.CONFIG['flightControllerVersion'] =  str(data.u8()) + '.'
+        self.CONFIG['flightControllerVersion'] += str(data.u8()) + '.'
+        self.CONFIG['flightControllerVersion'] += str(data.u8())
 
     def process_MSP_BUILD_INFO(self, data):
         dateLength = 11
-        buff = []
-        for i in range(dateLength):
-            buff.append(self.readbytes(data, size=8, unsigned=True))
-        
-        buff.append(32) # ascii space
-
         timeLength = 8
-        for i in range(timeLength):
-            buff.append(self.readbytes(data, size=8, unsigned=True))
-
-        self.CONFIG['buildInfo'] = bytearray(buff).decode("utf-8")
+        self.CONFIG['buildInfo'] = (data.read(dateLength) + b' '
+                                    + data.read(timeLength)).decode("utf-8")
 
     def process_MSP_BOARD_INFO(self, data):
-        identifier = ''
-        for i in range(4):
-            identifier += chr(self.readbytes(data, size=8, unsigned=True))
-
-        self.CONFIG['boardIdentifier'] = identifier
-        self.CONFIG['boardVersion'] = self.readbytes(data, size=16, unsigned=True)
-
-        self.CONFIG['boardType'] = self.readbytes(data, size=8, unsigned=True)
+        self.CONFIG['boardIdentifier'] = data.read(4).decode('latin1')
+        self.CONFIG['boardVersion'] = data.u16()
 
-        self.CONFIG['targetName'] = ""
+        self.CONFIG['boardType'] = data.u8()
 
-        self.CONFIG['commCapabilities'] = self.readbytes(data, size=8, unsigned=True)
+        self.CONFIG['commCapabilities'] = data.u8()
 
-        length = self.readbytes(data, size=8, unsigned=True)
-        
-        for i in range(length):
-            self.CONFIG['targetName'] += chr(self.readbytes(data, size=8, unsigned=True))
+        length = data.u8()
+        self.CONFIG['targetName'] = data.read(length).decode('latin1')
 
         self.CONFIG['boardName'] = ""
         self.CONFIG['manufacturerId'] = ""
         self.CONFIG['signature'] = []
-        self.CONFIG['boardName'] = ""
         self.CONFIG['mcuTypeId'] = ""
 
         if data:
-            length = self.readbytes(data, size=8, unsigned=True)
-            for i in range(length):
-                self.CONFIG['boardName'] += chr(self.readbytes(data, size=8, unsigned=True))
+            length = data.u8()
+            self.CONFIG['boardName'] = data.read(length).decode('latin1')
 
-            length = self.readbytes(data, size=8, unsigned=True)
-            for i in range(length):
-                self.CONFIG['manufacturerId'] += chr(self.readbytes(data, size=8, unsigned=True))
+            length = data.u8()
+            self.CONFIG['manufacturerId'] = data.read(length).decode('latin1')
 
-            for i in range(MSPy.SIGNATURE_LENGTH):
-                self.CONFIG['signature'].append(self.readbytes(data, size=8, unsigned=True))
+            self.CONFIG['signature'] = list(data.read(MSPy.SIGNATURE_LENGTH))
 
-            self.CONFIG['mcuTypeId'] = self.readbytes(data, size=8, unsigned=True)
+            self.CONFIG['mcuTypeId'] = data.u8()
 
     def process_MSP_NAME(self, data):
-        self.CONFIG['name'] = ''
-    
-        while len(data)>0:
-            char = self.readbytes(data, size=8, unsigned=True)
-            self.CONFIG['name'] += chr(char)
+        self.CONFIG['name'] = data.read(len(data)).decode('latin1')
 
     # def process_MSP_SET_CHANNEL_FORWARDING(self, data):
     #     logging.info('Channel forwarding saved')
 
     def process_MSP_CF_SERIAL_CONFIG(self, data):
-        self.SERIAL_CONFIG['ports'] = []
-        bytesPerPort = 1 + 2 + (1 * 4)
-        serialPortCount = int(len(data) / bytesPerPort)
+        serialPortCount = len(data) // _SERIAL_PORT_STRUCT.size
+        baud_rates = self.BAUD_RATES
+        ports = []
 
         for i in range(serialPortCount):
-            serialPort = {
-                'identifier': self.readbytes(data, size=8, unsigned=True),
-                'functions': self.serialPortFunctionMaskToFunctions(self.readbytes(data, size=16, unsigned=True)),
-                'msp_baudrate': self.BAUD_RATES[self.readbytes(data, size=8, unsigned=True)],
-                'gps_baudrate': self.BAUD_RATES[self.readbytes(data, size=8, unsigned=True)],
-                'telemetry_baudrate': self.BAUD_RATES[self.readbytes(data, size=8, unsigned=True)],
-                'blackbox_baudrate': self.BAUD_RATES[self.readbytes(data, size=8, unsigned=True)]
-            }
-
-            self.SERIAL_CONFIG['ports'].append(serialPort)
-
-    def process_MSP_SET_CF_SERIAL_CONFIG(self, data):
-        logging.info('Serial config saved')
+            (identifier, functionMask, msp_baud, gps_baud,
+             telemetry_baud, blackbox_baud) = data.unpack(_SERIAL_PORT_STRUCT)
+            ports.append({
+                'identifier': identifier,
+                'functions': self.serialPortFunctionMaskToFunctions(functionMask),
+                'msp_baudrate': baud_rates[msp_baud],
+                'gps_baudrate': baud_rates[gps_baud],
+                'telemetry_baudrate': baud_rates[telemetry_baud],
+                'blackbox_baudrate': baud_rates[blackbox_baud]
+            })
+
+        self.SERIAL_CONFIG['ports'] = ports
 
     def process_MSP_MODE_RANGES(self, data):
-        self.MODE_RANGES = [] # empty the array as new data is coming in
-
-        modeRangeCount = int(len(data) / 4) # 4 bytes per item.
-
-        for i in range(modeRangeCount):
-            modeRange = {
-                'id': self.readbytes(data, size=8, unsigned=True),
-                'auxChannelIndex': self.readbytes(data, size=8, unsigned=True),
-                'range': {
-                    'start': 900 + (self.readbytes(data, size=8, unsigned=True) * 25),
-                    'end': 900 + (self.readbytes(data, size=8, unsigned=True) * 25)
-                            }
-                }
-            self.MODE_RANGES.append(modeRange)
+        count, leftover = divmod(len(data), _MODE_RANGE_STRUCT.size) # 4 bytes per item.
+        if leftover:
+            logging.warning('Malformed MSP_MODE_RANGES payload: %d bytes', len(data))
+            return
+        records = data.read(count * _MODE_RANGE_STRUCT.size)
+
+        self.MODE_RANGES = [
+            {
+                'id': mode_id,
+                'auxChannelIndex': aux,
+                'range': ChannelRange(_PWM_LUT[start], _PWM_LUT[end])
+            } for mode_id, aux, start, end in _MODE_RANGE_STRUCT.iter_unpack(records)]
 
     def process_MSP_MODE_RANGES_EXTRA(self, data):
-        self.MODE_RANGES_EXTRA = [] # empty the array as new data is coming in
-
-        modeRangeExtraCount = self.readbytes(data, size=8, unsigned=True)
+        count = data.u8()
+        records = data.read(count * _MODE_RANGE_EXTRA_STRUCT.size)
 
-        for i in range(modeRangeExtraCount):
-            modeRangeExtra = {
-                'id': self.readbytes(data, size=8, unsigned=True),
-                'modeLogic': self.readbytes(data, size=8, unsigned=True),
-                'linkedTo': self.readbytes(data, size=8, unsigned=True)
-            }
-            self.MODE_RANGES_EXTRA.append(modeRangeExtra)
+        self.MODE_RANGES_EXTRA = [
+            {
+                'id': mode_id,
+                'modeLogic': mode_logic,
+                'linkedTo': linked_to
+            } for mode_id, mode_logic, linked_to
+              in _MODE_RANGE_EXTRA_STRUCT.iter_unpack(records)]
 
     def process_MSP_ADJUSTMENT_RANGES(self, data):
-        self.ADJUSTMENT_RANGES = [] # empty the array as new data is coming in
-
-        adjustmentRangeCount = int(len(data) / 6) # 6 bytes per item.
-
-        for i in range(adjustmentRangeCount):
-            adjustmentRange = {
-                'slotIndex': self.readbytes(data, size=8, unsigned=True),
-                'auxChannelIndex': self.readbytes(data, size=8, unsigned=True),
-                'range': {
-                    'start': 900 + (self.readbytes(data, size=8, unsigned=True) * 25),
-                    'end': 900 + (self.readbytes(data, size=8, unsigned=True) * 25)
-                },
-                'adjustmentFunction': self.readbytes(data, size=8, unsigned=True),
-                'auxSwitchChannelIndex': self.readbytes(data, size=8, unsigned=True)
-            }
-            self.ADJUSTMENT_RANGES.append(adjustmentRange)
+        count, leftover = divmod(len(data), _ADJUSTMENT_RANGE_STRUCT.size) # 6 bytes per item.
+        if leftover:
+            logging.warning('Malformed MSP_ADJUSTMENT_RANGES payload: %d bytes', len(data))
+            return
+        records = data.read(count * _ADJUSTMENT_RANGE_STRUCT.size)
+
+        self.ADJUSTMENT_RANGES = [
+            {
+                'slotIndex': slot,
+                'auxChannelIndex': aux,
+                'range': ChannelRange(_PWM_LUT[start], _PWM_LUT[end]),
+                'adjustmentFunction': function,
+                'auxSwitchChannelIndex': switch
+            } for slot, aux, start, end, function, switch
+              in _ADJUSTMENT_RANGE_STRUCT.iter_unpack(records)]
 
     def process_MSP_RX_CONFIG(self, data):
-        self.RX_CONFIG['serialrx_provider'] = self.readbytes(data, size=8, unsigned=True)
-        # maxcheck for INAV
-        self.RX_CONFIG['stick_max'] = self.readbytes(data, size=16, unsigned=True)
-        # midrc for INAV
-        self.RX_CONFIG['stick_center'] = self.readbytes(data, size=16, unsigned=True)
-        # mincheck for INAV
-        self.RX_CONFIG['stick_min'] = self.readbytes(data, size=16, unsigned=True)
-        self.RX_CONFIG['spektrum_sat_bind'] = self.readbytes(data, size=8, unsigned=True)
-        self.RX_CONFIG['rx_min_usec'] = self.readbytes(data, size=16, unsigned=True)
-        self.RX_CONFIG['rx_max_usec'] = self.readbytes(data, size=16, unsigned=True)
-        self.RX_CONFIG['rcInterpolation'] = self.readbytes(data, size=8, unsigned=True)
-        self.RX_CONFIG['rcInterpolationInterval'] = self.readbytes(data, size=8, unsigned=True)
-        self.RX_CONFIG['airModeActivateThreshold'] = self.readbytes(data, size=16, unsigned=True)  
-        # spirx_protocol for INAV
-        self.RX_CONFIG['rxSpiProtocol'] = self.readbytes(data, size=8, unsigned=True)
-        # spirx_id for INAV
-        self.RX_CONFIG['rxSpiId'] = self.readbytes(data, size=32, unsigned=True)
-        # spirx_channel_count for INAV
-        self.RX_CONFIG['rxSpiRfChannelCount'] = self.readbytes(data, size=8, unsigned=True)
-        self.RX_CONFIG['fpvCamAngleDegrees'] = self.readbytes(data, size=8, unsigned=True)
         if self.INAV:
-            self.RX_CONFIG['receiver_type'] = self.readbytes(data, size=8, unsigned=True)
+            keys, msg_struct = _RX_CONFIG_KEYS_INAV, _RX_CONFIG_STRUCT_INAV
         else:
-            self.RX_CONFIG['rcInterpolationChannels'] = self.readbytes(data, size=8, unsigned=True)
-            self.RX_CONFIG['rcSmoothingType'] = self.readbytes(data, size=8, unsigned=True)
-            self.RX_CONFIG['rcSmoothingInputCutoff'] = self.readbytes(data, size=8, unsigned=True)
-            self.RX_CONFIG['rcSmoothingDerivativeCutoff'] = self.readbytes(data, size=8, unsigned=True)
-            self.RX_CONFIG['rcSmoothingInputType'] = self.readbytes(data, size=8, unsigned=True)
-            self.RX_CONFIG['rcSmoothingDerivativeType'] = self.readbytes(data, size=8, unsigned=True)
-    def process_MSP_FAILSAFE_CONFIG(self, data):
-        self.FAILSAFE_CONFIG['failsafe_delay'] = self.readbytes(data, size=8, unsigned=True)
-        self.FAILSAFE_CONFIG['failsafe_off_delay'] = self.readbytes(data, size=8, unsigned=True)
-        self.FAILSAFE_CONFIG['failsafe_throttle'] = self.readbytes(data, size=16, unsigned=True)
-        self.FAILSAFE_CONFIG['failsafe_switch_mode'] = self.readbytes(data, size=8, unsigned=True)
-        self.FAILSAFE_CONFIG['failsafe_throttle_low_delay'] = self.readbytes(data, size=16, unsigned=True)
-        self.FAILSAFE_CONFIG['failsafe_procedure'] = self.readbytes(data, size=8, unsigned=True)
-
+            keys, msg_struct = _RX_CONFIG_KEYS_BF, _RX_CONFIG_STRUCT_BF
+        self.RX_CONFIG.update(zip(keys, data.unpack(msg_struct)))
     def process_MSP_RXFAIL_CONFIG(self, data):
-        self.RXFAIL_CONFIG = [] # empty the array as new data is coming in
-
-        channelCount = int(len(data) / 3)
-        for i in range(channelCount):
-            rxfailChannel = {
-                'mode':  self.readbytes(data, size=8, unsigned=True),
-                'value': self.readbytes(data, size=16, unsigned=True)
-            }
-            self.RXFAIL_CONFIG.append(rxfailChannel)
+        count, leftover = divmod(len(data), _RXFAIL_STRUCT.size)
+        if leftover:
+            logging.warning('Malformed MSP_RXFAIL_CONFIG payload: %d bytes', len(data))
+            return
+        records = data.read(count * _RXFAIL_STRUCT.size)
+
+        self.RXFAIL_CONFIG = [
+            {
+                'mode':  mode,
+                'value': value
+            } for mode, value in _RXFAIL_STRUCT.iter_unpack(records)]
 
     def process_MSP_ADVANCED_CONFIG(self, data):
-        self.PID_ADVANCED_CONFIG['gyro_sync_denom'] = self.readbytes(data, size=8, unsigned=True)
-        self.PID_ADVANCED_CONFIG['pid_process_denom'] = self.readbytes(data, size=8, unsigned=True)
-        self.PID_ADVANCED_CONFIG['use_unsyncedPwm'] = self.readbytes(data, size=8, unsigned=True)
-        self.PID_ADVANCED_CONFIG['fast_pwm_protocol'] = self.readbytes(data, size=8, unsigned=True)
-        self.PID_ADVANCED_CONFIG['motor_pwm_rate'] = self.readbytes(data, size=16, unsigned=True)
-
-        self.PID_ADVANCED_CONFIG['digitalIdlePercent'] = self.readbytes(data, size=16, unsigned=True) / 100
+        pid_advanced_config = self.PID_ADVANCED_CONFIG
+        (pid_advanced_config['gyro_sync_denom'], pid_advanced_config['pid_process_denom'],
+         pid_advanced_config['use_unsyncedPwm'], pid_advanced_config['fast_pwm_protocol'],
+         pid_advanced_config['motor_pwm_rate'],
+         digitalIdlePercent) = data.unpack(_ADVANCED_CONFIG_STRUCT)
+        pid_advanced_config['digitalIdlePercent'] = digitalIdlePercent / 100
 
     def process_MSP_FILTER_CONFIG(self, data):
-        self.FILTER_CONFIG['gyro_lowpass_hz'] = self.readbytes(data, size=8, unsigned=True)
-        self.FILTER_CONFIG['dterm_lowpass_hz'] = self.readbytes(data, size=16, unsigned=True)
-        self.FILTER_CONFIG['yaw_lowpass_hz'] = self.readbytes(data, size=16, unsigned=True)
-        
-        self.FILTER_CONFIG['gyro_notch_hz'] = self.readbytes(data, size=16, unsigned=True)
-        self.FILTER_CONFIG['gyro_notch_cutoff'] = self.readbytes(data, size=16, unsigned=True)
-        self.FILTER_CONFIG['dterm_notch_hz'] = self.readbytes(data, size=16, unsigned=True)
-        self.FILTER_CONFIG['dterm_notch_cutoff'] = self.readbytes(data, size=16, unsigned=True)
-
-        self.FILTER_CONFIG['gyro_notch2_hz'] = self.readbytes(data, size=16, unsigned=True)
-        self.FILTER_CONFIG['gyro_notch2_cutoff'] = self.readbytes(data, size=16, unsigned=True)
-
-        if not self.INAV:
-            self.FILTER_CONFIG['dterm_lowpass_type'] = self.readbytes(data, size=8, unsigned=True)
-
-            self.FILTER_CONFIG['gyro_hardware_lpf'] = self.readbytes(data, size=8, unsigned=True)
-            
-            self.readbytes(data, size=8, unsigned=True) # must consume this byte
+        # replaced in the dispatch table by the right variant at connect time;
+        # kept branching for direct callers and pre-connect replies
+        if self.INAV:
+            self._process_filter_config_inav(data)
+        else:
+            self._process_filter_config_bf(data)
 
-            self.FILTER_CONFIG['gyro_lowpass_hz'] = self.readbytes(data, size=16, unsigned=True)
-            self.FILTER_CONFIG['gyro_lowpass2_hz'] = self.readbytes(data, size=16, unsigned=True)
-            self.FILTER_CONFIG['gyro_lowpass_type'] = self.readbytes(data, size=8, unsigned=True)
-            self.FILTER_CONFIG['gyro_lowpass2_type'] = self.readbytes(data, size=8, unsigned=True)
-            self.FILTER_CONFIG['dterm_lowpass2_hz'] = self.readbytes(data, size=16, unsigned=True)
+    def _process_filter_config_inav(self, data):
+        self.FILTER_CONFIG.update(zip(_FILTER_CONFIG_KEYS_INAV,
+                                      data.unpack(_FILTER_CONFIG_STRUCT_INAV)))
 
-            self.FILTER_CONFIG['gyro_32khz_hardware_lpf'] = 0
+    def _process_filter_config_bf(self, data):
+        self.FILTER_CONFIG.update(zip(_FILTER_CONFIG_KEYS_BF,
+                                      data.unpack(_FILTER_CONFIG_STRUCT_BF)))
+        self.FILTER_CONFIG['gyro_32khz_hardware_lpf'] = 0
 
-            self.FILTER_CONFIG['dterm_lowpass2_type'] = self.readbytes(data, size=8, unsigned=True)
-            self.FILTER_CONFIG['gyro_lowpass_dyn_min_hz'] = self.readbytes(data, size=16, unsigned=True)
-            self.FILTER_CONFIG['gyro_lowpass_dyn_max_hz'] = self.readbytes(data, size=16, unsigned=True)
-            self.FILTER_CONFIG['dterm_lowpass_dyn_min_hz'] = self.readbytes(data, size=16, unsigned=True)
-            self.FILTER_CONFIG['dterm_lowpass_dyn_max_hz'] = self.readbytes(data, size=16, unsigned=True)
+    def process_MSP_PID_ADVANCED(self, data):
+        if self.INAV:
+            self._process_pid_advanced_inav(data)
         else:
-            self.FILTER_CONFIG['accNotchHz'] = self.readbytes(data, size=16, unsigned=True)
-            self.FILTER_CONFIG['accNotchCutoff'] = self.readbytes(data, size=16, unsigned=True)
-            self.FILTER_CONFIG['gyroStage2LowpassHz'] = self.readbytes(data, size=16, unsigned=True)
+            self._process_pid_advanced_bf(data)
 
-    def process_MSP_SET_PID_ADVANCED(self, data):
-        logging.info("Advanced PID settings saved")
+    def _process_pid_advanced_inav(self, data):
+        self.ADVANCED_TUNING.update(zip(_PID_ADVANCED_KEYS_INAV,
+                                        data.unpack(_PID_ADVANCED_STRUCT_INAV)))
 
-    def process_MSP_PID_ADVANCED(self, data):
-        self.ADVANCED_TUNING['rollPitchItermIgnoreRate'] = self.readbytes(data, size=16, unsigned=True)
-        self.ADVANCED_TUNING['yawItermIgnoreRate'] = self.readbytes(data, size=16, unsigned=True)
-        self.ADVANCED_TUNING['yaw_p_limit'] = self.readbytes(data, size=16, unsigned=True)
-        self.ADVANCED_TUNING['deltaMethod'] = self.readbytes(data, size=8, unsigned=True)
-        self.ADVANCED_TUNING['vbatPidCompensation'] = self.readbytes(data, size=8, unsigned=True)
-        if not self.INAV:
-            self.ADVANCED_TUNING['feedforwardTransition'] = self.readbytes(data, size=8, unsigned=True)
-
-            self.ADVANCED_TUNING['dtermSetpointWeight'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['toleranceBand'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['toleranceBandReduction'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['itermThrottleGain'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['pidMaxVelocity'] = self.readbytes(data, size=16, unsigned=True)
-            self.ADVANCED_TUNING['pidMaxVelocityYaw'] = self.readbytes(data, size=16, unsigned=True)
-
-            self.ADVANCED_TUNING['levelAngleLimit'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['levelSensitivity'] = self.readbytes(data, size=8, unsigned=True)
-
-            self.ADVANCED_TUNING['itermThrottleThreshold'] = self.readbytes(data, size=16, unsigned=True)
-            self.ADVANCED_TUNING['itermAcceleratorGain'] = self.readbytes(data, size=16, unsigned=True)
-
-            self.ADVANCED_TUNING['dtermSetpointWeight'] = self.readbytes(data, size=16, unsigned=True)
-
-            self.ADVANCED_TUNING['itermRotation'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['smartFeedforward'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['itermRelax'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['itermRelaxType'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['absoluteControlGain'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['throttleBoost'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['acroTrainerAngleLimit'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['feedforwardRoll']  = self.readbytes(data, size=16, unsigned=True)
-            self.ADVANCED_TUNING['feedforwardPitch'] = self.readbytes(data, size=16, unsigned=True)
-            self.ADVANCED_TUNING['feedforwardYaw']   = self.readbytes(data, size=16, unsigned=True)
-            self.ADVANCED_TUNING['antiGravityMode']  = self.readbytes(data, size=8, unsigned=True)
-
-            self.ADVANCED_TUNING['dMinRoll'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['dMinPitch'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['dMinYaw'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['dMinGain'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['dMinAdvance'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['useIntegratedYaw'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['integratedYawRelax'] = self.readbytes(data, size=8, unsigned=True)
-        else:
-            self.ADVANCED_TUNING['setpointRelaxRatio'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['dtermSetpointWeight'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['pidSumLimit'] = self.readbytes(data, size=16, unsigned=True)
-            self.ADVANCED_TUNING['itermThrottleGain'] = self.readbytes(data, size=8, unsigned=True)
-            self.ADVANCED_TUNING['axisAccelerationLimitRollPitch'] = self.readbytes(data, size=16, unsigned=True)
-            self.ADVANCED_TUNING['axisAccelerationLimitYaw'] = self.readbytes(data, size=16, unsigned=True)
+    def _process_pid_advanced_bf(self, data):
+        self.ADVANCED_TUNING.update(zip(_PID_ADVANCED_KEYS_BF,
+                                        data.unpack(_PID_ADVANCED_STRUCT_BF)))
 
     def process_MSP_SENSOR_CONFIG(self, data):
-        self.SENSOR_CONFIG['acc_hardware'] = self.readbytes(data, size=8, unsigned=True)
-        self.SENSOR_CONFIG['baro_hardware'] = self.readbytes(data, size=8, unsigned=True)
-        self.SENSOR_CONFIG['mag_hardware'] = self.readbytes(data, size=8, unsigned=True)
+        self.SENSOR_CONFIG['acc_hardware'] = data.u8()
+        self.SENSOR_CONFIG['baro_hardware'] = data.u8()
+        self.SENSOR_CONFIG['mag_hardware'] = data.u8()
         if self.INAV:
-            self.SENSOR_CONFIG['pitot'] = self.readbytes(data, size=8, unsigned=True)
-            self.SENSOR_CONFIG['rangefinder'] = self.readbytes(data, size=8, unsigned=True)
-            self.SENSOR_CONFIG['opflow'] = self.readbytes(data, size=8, unsigned=True)
+            self.SENSOR_CONFIG['pitot'] = data.u8()
+            self.SENSOR_CONFIG['rangefinder'] = data.u8()
+            self.SENSOR_CONFIG['opflow'] = data.u8()
 
     def process_MSP_DATAFLASH_SUMMARY(self, data):
-        flags = self.readbytes(data, size=8, unsigned=True)
-        self.DATAFLASH['ready'] = ((flags & 1) != 0)
-        self.DATAFLASH['supported'] = ((flags & 2) != 0)
-        self.DATAFLASH['sectors'] = self.readbytes(data, size=32, unsigned=True)
-        self.DATAFLASH['totalSize'] = self.readbytes(data, size=32, unsigned=True)
-        self.DATAFLASH['usedSize'] = self.readbytes(data, size=32, unsigned=True)
+        dataflash = self.DATAFLASH
+        (flags, dataflash['sectors'], dataflash['totalSize'],
+         dataflash['usedSize']) = data.unpack(_DATAFLASH_SUMMARY_STRUCT)
+        dataflash['ready'] = ((flags & 1) != 0)
+        dataflash['supported'] = ((flags & 2) != 0)
         # update_dataflash_global();
 
-    def process_MSP_DATAFLASH_ERASE(self, data):
-        logging.info("Data flash erase begun...")
-
     def process_MSP_SDCARD_SUMMARY(self, data):
-        flags = self.readbytes(data, size=8, unsigned=True)
-
-        self.SDCARD['supported'] = ((flags & 0x01) != 0)
-        self.SDCARD['state'] = self.readbytes(data, size=8, unsigned=True)
-        self.SDCARD['filesystemLastError'] = self.readbytes(data, size=8, unsigned=True)
-        self.SDCARD['freeSizeKB'] = self.readbytes(data, size=32, unsigned=True)
-        self.SDCARD['totalSizeKB'] = self.readbytes(data, size=32, unsigned=True)
+        sdcard = self.SDCARD
+        (flags, sdcard['state'], sdcard['filesystemLastError'],
+         sdcard['freeSizeKB'], sdcard['totalSizeKB']) = data.unpack(_SDCARD_SUMMARY_STRUCT)
+        sdcard['supported'] = ((flags & 0x01) != 0)
 
     def process_MSP_BLACKBOX_CONFIG(self, data):
         if not self.INAV:
-            self.BLACKBOX['supported'] = (self.readbytes(data, size=8, unsigned=True) & 1) != 0
-            self.BLACKBOX['blackboxDevice'] = self.readbytes(data, size=8, unsigned=True)
-            self.BLACKBOX['blackboxRateNum'] = self.readbytes(data, size=8, unsigned=True)
-            self.BLACKBOX['blackboxRateDenom'] = self.readbytes(data, size=8, unsigned=True)
+            self.BLACKBOX['supported'] = (data.u8() & 1) != 0
+            self.BLACKBOX['blackboxDevice'] = data.u8()
+            self.BLACKBOX['blackboxRateNum'] = data.u8()
+            self.BLACKBOX['blackboxRateDenom'] = data.u8()
 
-            self.BLACKBOX['blackboxPDenom'] = self.readbytes(data, size=16, unsigned=True)
+            self.BLACKBOX['blackboxPDenom'] = data.u16()
         else:
             pass # API no longer supported (INAV 2.3.0)
-    def process_MSP_SET_BLACKBOX_CONFIG(self, data):
-        logging.info("Blackbox config saved")
-
     # TODO: This changed and it will need to check the BF version to decode things correctly
     # def process_MSP_TRANSPONDER_CONFIG(self, data):
     #     bytesRemaining = len(data)
 
-    #     providerCount = self.readbytes(data, size=8, unsigned=True)
+    #     providerCount = data.u8()
     #     bytesRemaining-=1
 
     #     self.TRANSPONDER['supported'] = providerCount > 0
@@ -1543,103 +1542,17 @@ class MSPy:
 
     #     for i in range(providerCount):
     #         provider = {
-    #             'id': self.readbytes(data, size=8, unsigned=True),
-    #             'dataLength': self.readbytes(data, size=8, unsigned=True)
+    #             'id': data.u8(),
+    #             'dataLength': data.u8()
     #         }
     #         bytesRemaining -= 2
 
     #         self.TRANSPONDER['providers'].append(provider)
 
-    #     self.TRANSPONDER['provider'] = self.readbytes(data, size=8, unsigned=True)
+    #     self.TRANSPONDER['provider'] = data.u8()
     #     bytesRemaining-=1
 
     #     self.TRANSPONDER['data'] = []
     #     for i in range(bytesRemaining):
-    #         self.TRANSPONDER['data'].append(self.readbytes(data, size=8, unsigned=True))
-
-    def process_MSP_SET_TRANSPONDER_CONFIG(self, data):
-        logging.info("Transponder config saved")
+    #         self.TRANSPONDER['data'].append(data.u8())
 
-    def process_MSP_SET_MODE_RANGE(self, data):
-        logging.info('Mode range saved')
-
-    def process_MSP_SET_ADJUSTMENT_RANGE(self, data):
-        logging.info('Adjustment range saved')
-        
-    def process_MSP_SET_BOARD_ALIGNMENT_CONFIG(self, data):
-        logging.info('Board alignment saved')
-        
-    def process_MSP_PID_CONTROLLER(self, data):
-        self.PID['controller'] = self.readbytes(data, size=8, unsigned=True)
-        
-    def process_MSP_SET_PID_CONTROLLER(self, data):
-        logging.info('PID controller changed')
-        
-    def process_MSP_SET_LOOP_TIME(self, data):
-        logging.info('Looptime saved')
-        
-    def process_MSP_SET_ARMING_CONFIG(self, data):
-        logging.info('Arming config saved')
-        
-    def process_MSP_SET_RESET_CURR_PID(self, data):
-        logging.info('Current PID profile reset')
-        
-    def process_MSP_SET_MOTOR_3D_CONFIG(self, data):
-        logging.info('3D settings saved')
-        
-    def process_MSP_SET_MIXER_CONFIG(self, data):
-        logging.info('Mixer config saved')
-        
-    def process_MSP_SET_RC_DEADBAND(self, data):
-        logging.info('Rc controls settings saved')
-        
-    def process_MSP_SET_SENSOR_ALIGNMENT(self, data):
-        logging.info('Sensor alignment saved')
-        
-    def process_MSP_SET_RX_CONFIG(self, data):
-        logging.info('Rx config saved')
-        
-    def process_MSP_SET_RXFAIL_CONFIG(self, data):
-        logging.info('Rxfail config saved')
-        
-    def process_MSP_SET_FAILSAFE_CONFIG(self, data):
-        logging.info('Failsafe config saved')
-        
-    def process_MSP_OSD_CONFIG(self, data):
-        logging.info('OSD_CONFIG received')
-        
-    def process_MSP_SET_OSD_CONFIG(self, data):
-        logging.info('OSD config set')
-        
-    def process_MSP_OSD_CHAR_READ(self, data):
-        logging.info('OSD char received')
-        
-    def process_MSP_OSD_CHAR_WRITE(self, data):
-        logging.info('OSD char uploaded')
-        
-    def process_MSP_VTX_CONFIG(self, data):
-        logging.info('VTX_CONFIG received')
-        
-    def process_MSP_SET_VTX_CONFIG(self, data):
-        logging.info('VTX_CONFIG set')
-        
-    def process_MSP_SET_NAME(self, data):
-        logging.info('Name set')
-        
-    def process_MSP_SET_FILTER_CONFIG(self, data):
-        logging.info('Filter config set')
-        
-    def process_MSP_SET_ADVANCED_CONFIG(self, data):
-        logging.info('Advanced config parameters set')
-        
-    def process_MSP_SET_SENSOR_CONFIG(self, data):
-        logging.info('Sensor config parameters set')
-        
-    def process_MSP_COPY_PROFILE(self, data):
-        logging.info('Copy profile')
-        
-    def process_MSP_ARMING_DISABLE(self, data):
-        logging.info('Arming disable')
-        
-    def process_MSP_SET_RTC(self, data):
-        logging.info('Real time clock set')
\ No newline at end of file
@@ -1,7 +1,12 @@
+import struct
 import time
 
 JUMBO_FRAME_SIZE_LIMIT = 255
 
+_U16 = struct.Struct('<H')
+_I16 = struct.Struct('<h')
+_U32 = struct.Struct('<I')
+
 
 dataHandler_init = {
     'msp_version':                1,
@@ -22,14 +27,100 @@ dataHandler_init = {
 }
 
 
-read_buffer = b''
-def _read(local_read):
+class MSPDataView:
+    """Read cursor over a received MSP payload.
+
+    Replaces the old habit of pop(0)-ing bytes off the message buffer:
+    every left-pop shifts the whole remaining buffer, so consuming an
+    N-byte payload cost O(N^2). The cursor just advances an offset.
+    len() reports the bytes not yet consumed, which also keeps the
+    truth-value checks in the process_MSP_* handlers working.
+    """
+    __slots__ = ('buf', 'pos')
+
+    def __init__(self, buf):
+        self.buf = buf
+        self.pos = 0
+
+    def __len__(self):
+        # backstop: pos should never pass the end (read/skip/unpack all
+        # raise on overrun), but __len__ must not go negative regardless
+        remaining = len(self.buf) - self.pos
+        return remaining if remaining > 0 else 0
+
+    def unpack(self, s):
+        """Unpack a whole struct.Struct at the cursor and advance past it."""
+        values = s.unpack_from(self.buf, self.pos)
+        self.pos += s.size
+        return values
+
+    def read(self, n):
+        """Return the next n bytes and advance the cursor past them.
+
+        Raises IndexError when fewer than n bytes remain, matching the
+        old pop-based readers: a truncated payload must fail the message,
+        not hand a short byte string to the handler.
+        """
+        start = self.pos
+        end = start + n
+        if end > len(self.buf):
+            raise IndexError('read past end of payload')
+        self.pos = end
+        return bytes(self.buf[start:end])
+
+    def skip(self, n):
+        """Advance the cursor past n bytes without reading them.
+
+        Raises IndexError on overrun: lengths come straight from the
+        payload, so a bad one must hit the -4 path in process_recv_data
+        instead of leaving the cursor past the end of the buffer.
+        """
+        new_pos = self.pos + n
+        if new_pos > len(self.buf):
+            raise IndexError('skip past end of payload')
+        self.pos = new_pos
+
+    # scalar readers for the handlers whose layout is decided field by field
+    # (cheaper than MSPy.readbytes: no kwargs, no table lookup)
+    def u8(self):
+        value = self.buf[self.pos]
+        self.pos += 1
+        return value
+
+    def u16(self):
+        value = _U16.unpack_from(self.buf, self.pos)[0]
+        self.pos += 2
+        return value
+
+    def i16(self):
+        value = _I16.unpack_from(self.buf, self.pos)[0]
+        self.pos += 2
+        return value
+
+    def u32(self):
+        value = _U32.unpack_from(self.buf, self.pos)[0]
+        self.pos += 4
+        return value
+
+
+def buffered_reader(local_read):
+    """Wrap a port read function in a buffered reader.
+
+    The wrapper satisfies requests from a rolling buffer and only hits the
+    port when it runs short -- local_read drains everything the kernel has
+    (in_waiting), so one syscall usually feeds several MSP frames. Each
+    wrapper owns its buffer, so build one per connection and reuse it
+    (MSPy keeps its own); the receive_* functions accept either a wrapped
+    or a raw reader.
+    """
+    read_buffer = b''
+
     def read(size=None, buffer=None):
-        global read_buffer
+        nonlocal read_buffer
         if buffer:
             read_buffer = buffer
             return
-            
+
         output = b''
         if size:
             while True:
@@ -46,8 +137,15 @@ def _read(local_read):
             output += read_buffer
             read_buffer = b''
         return output
+
+    read.is_buffered = True
     return read
 
+def _read(local_read):
+    if getattr(local_read, 'is_buffered', False):
+        return local_read
+    return buffered_reader(local_read)
+
 def receive_raw_msg(local_read, logging, timeout_exception, size, timeout = 10):
     """Receive multiple bytes at once when it's not a jumbo frame.
     Returns
@@ -56,7 +154,6 @@ def receive_raw_msg(local_read, logging, timeout_exception, size, timeout = 10):
         data received
     """
     local_read = _read(local_read)
-    msg_header = b''
     timeout = time.time() + timeout
     while True:
         if time.time() >= timeout:
@@ -66,8 +163,12 @@ def receive_raw_msg(local_read, logging, timeout_exception, size, timeout = 10):
         if msg_header:
             if ord(msg_header) == 36: # $
                 break
-    msg = local_read(size=(size - 1)) # -1 to compensate for the $
-    return msg_header + msg
+    # single output buffer ($ plus the rest of the frame): callers unpack_from
+    # at an offset, so the payload is never sliced or concatenated again
+    msg = bytearray(size)
+    msg[0] = 36 # $
+    msg[1:] = local_read(size=(size - 1)) # -1 to compensate for the $
+    return msg
 
 def receive_msg(local_read, logging, output_raw_bytes=False):
     """Receive an MSP message from the serial port
@@ -252,14 +353,12 @@ def receive_msg(local_read, logging, output_raw_bytes=False):
                         dataHandler['packet_error'] = 1 # sends it to the error state
                         break 
                 elif dataHandler['msp_version'] == 2:
-                    dataHandler['message_checksum'] = 0
-                    dataHandler['message_checksum'] = _crc8_dvb_s2(dataHandler['message_checksum'], 0) # flag
-                    dataHandler['message_checksum'] = _crc8_dvb_s2(dataHandler['message_checksum'], dataHandler['code'] & 0xFF) # code LOW
-                    dataHandler['message_checksum'] = _crc8_dvb_s2(dataHandler['message_checksum'], (dataHandler['code'] & 0xFF00) >> 8) # code HIGH
-                    dataHandler['message_checksum'] = _crc8_dvb_s2(dataHandler['message_checksum'], dataHandler['message_length_expected'] & 0xFF) #  HIGH
-                    dataHandler['message_checksum'] = _crc8_dvb_s2(dataHandler['message_checksum'], (dataHandler['message_length_expected'] & 0xFF00) >> 8) #  HIGH
-                    for si in range(dataHandler['message_length_received']):
-                        dataHandler['message_checksum'] = _crc8_dvb_s2(dataHandler['message_checksum'], dataHandler['message_buffer'][si])
+                    checksum = _crc8_dvb_s2_buf(0, (0, # flag
+                                                    dataHandler['code'] & 0xFF, # code LOW
+                                                    (dataHandler['code'] & 0xFF00) >> 8, # code HIGH
+                                                    dataHandler['message_length_expected'] & 0xFF, # length LOW
+                                                    (dataHandler['message_length_expected'] & 0xFF00) >> 8)) # length HIGH
+                    dataHandler['message_checksum'] = _crc8_dvb_s2_buf(checksum, dataHandler['message_buffer'])
                     if dataHandler['message_checksum'] == data:
                         # checksum is correct, message received, store dataview
                         logging.debug("Message received (length {1}) - Code {0}".format(dataHandler['code'], dataHandler['message_length_received']))
@@ -287,8 +386,8 @@ def receive_msg(local_read, logging, output_raw_bytes=False):
         return dataHandler 
 
 
-def prepare_RAW_msg(mspv, code, data=[]):
-    """Send a RAW MSP message through the serial port
+def prepare_RAW_msg(mspv, code, data=b'', buf=None):
+    """Prepare a RAW MSP message to be sent through the serial port
     Based on betaflight-configurator (https://git.io/fjRxz)
 
     Parameters
@@ -296,17 +395,19 @@ def prepare_RAW_msg(mspv, code, data=[]):
     code : int
         MSP Code
     
-    data: list or bytearray, optional
+    data: list, bytes or bytearray, optional
         Data to be sent (default is [])
+
+    buf: bytearray, optional
+        Reusable output buffer; when big enough the message is written into
+        it instead of allocating a fresh bytearray (default is None)
         
     Returns
     -------
-    int
-        number of bytes of data actually written (including 6 bytes header)
+    memoryview
+        the message ready to be written (header + data + crc)
     """
 
-    res = -1
-
     # Always reserve 6 bytes for protocol overhead
     # $ + M + < + data_length + msg_code + data + msg_crc
     len_data = len(data)
@@ -316,45 +417,41 @@ def prepare_RAW_msg(mspv, code, data=[]):
 
     if mspv==1: # MSP V1
         size = len_data + 6
-        checksum = 0
-
-        bufView = bytearray(size)
-
-        bufView[0] = 36 #$
-        bufView[1] = 77 #M
-        bufView[2] = 60 #<
-        bufView[3] = len_data
-        bufView[4] = code
+        if buf is None or len(buf) < size:
+            buf = bytearray(size)
 
-        checksum = bufView[3] ^ bufView[4]
+        buf[0] = 36 #$
+        buf[1] = 77 #M
+        buf[2] = 60 #<
+        buf[3] = len_data
+        buf[4] = code
+        buf[5:5+len_data] = data
 
-        for i in range(len_data):
-            bufView[i + 5] = data[i]
-            checksum ^= bufView[i + 5]
-
-        bufView[-1] = checksum
+        checksum = 0
+        for si in range(3, size-1):
+            checksum ^= buf[si]
+        buf[size-1] = checksum
 
     elif mspv==2: # MSP V2
         size = len_data + 9
-        checksum = 0
-        bufView = bytearray(size)
-        bufView[0] = 36 #$ 
-        bufView[1] = 88 #X
-        bufView[2] = 60 #<
-        bufView[3] = 0 #flag: reserved, set to 0
-        bufView[4] = code & 0xFF #code lower byte
-        bufView[5] = (code & 0xFF00) >> 8 #code upper byte
-        bufView[6] = len_data & 0xFF #len_data lower byte
-        bufView[7] = (len_data & 0xFF00) >> 8 #len_data upper byte
-        bufView[8:8+len_data] = data
-        for si in range(3, size-1):
-            checksum = _crc8_dvb_s2(checksum, bufView[si])
-        bufView[-1] = checksum
+        if buf is None or len(buf) < size:
+            buf = bytearray(size)
+
+        buf[0] = 36 #$ 
+        buf[1] = 88 #X
+        buf[2] = 60 #<
+        buf[3] = 0 #flag: reserved, set to 0
+        buf[4] = code & 0xFF #code lower byte
+        buf[5] = (code & 0xFF00) >> 8 #code upper byte
+        buf[6] = len_data & 0xFF #len_data lower byte
+        buf[7] = (len_data & 0xFF00) >> 8 #len_data upper byte
+        buf[8:8+len_data] = data
+        buf[size-1] = _crc8_dvb_s2_buf(0, memoryview(buf)[3:size-1])
 
     else:
         return []
 
-    return bufView
+    return memoryview(buf)[:size]
 
 
 # def _crc8_dvb_s2(crc, ch):
@@ -371,7 +468,7 @@ def prepare_RAW_msg(mspv, code, data=[]):
 
 
 # from https://github.com/fishpepper/openTCO/blob/master/crc8.h
-crc8_table = [
+crc8_table = bytes([
     0x00, 0xd5, 0x7f, 0xaa, 0xfe, 0x2b, 0x81, 0x54, 0x29, 0xfc, 0x56, 0x83, 0xd7, 0x02, 0xa8, 0x7d,
     0x52, 0x87, 0x2d, 0xf8, 0xac, 0x79, 0xd3, 0x06, 0x7b, 0xae, 0x04, 0xd1, 0x85, 0x50, 0xfa, 0x2f,
     0xa4, 0x71, 0xdb, 0x0e, 0x5a, 0x8f, 0x25, 0xf0, 0x8d, 0x58, 0xf2, 0x27, 0x73, 0xa6, 0x0c, 0xd9,
@@ -388,7 +485,15 @@ crc8_table = [
     0x20, 0xf5, 0x5f, 0x8a, 0xde, 0x0b, 0xa1, 0x74, 0x09, 0xdc, 0x76, 0xa3, 0xf7, 0x22, 0x88, 0x5d,
     0xd6, 0x03, 0xa9, 0x7c, 0x28, 0xfd, 0x57, 0x82, 0xff, 0x2a, 0x80, 0x55, 0x01, 0xd4, 0x7e, 0xab,
     0x84, 0x51, 0xfb, 0x2e, 0x7a, 0xaf, 0x05, 0xd0, 0xad, 0x78, 0xd2, 0x07, 0x53, 0x86, 0x2c, 0xf9,
-]
+])
 
 def _crc8_dvb_s2(crc, ch):
-    return crc8_table[crc^ch]
\ No newline at end of file
+    return crc8_table[crc^ch]
+
+def _crc8_dvb_s2_buf(crc, buf):
+    # whole-buffer version: one call instead of one per byte, with the
+    # table bound to a local so the loop is just index-xor-index
+    table = crc8_table
+    for ch in buf:
+        crc = table[crc^ch]
+    return crc
\ No newline at end of file
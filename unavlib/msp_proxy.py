@@ -60,6 +60,10 @@ def TCPServer(pipe, HOST, PORT, timeout=1/10000, time2sleep=0):
                     logging.debug(f"[{PORT}] Socket ({addr}) returned recvbuffer {recvbuffer}")
                     return recvbuffer
 
+                # one buffered reader per connection so bytes left over from
+                # a previous receive_msg call are not lost
+                receive = msp_ctrl.buffered_reader(receive)
+
                 def send(msg):
                     try:
                         conn.sendall(msg)
@@ -118,6 +122,7 @@ def main(ports, device, baudrate, timeout=1/1000):
         _,_,_ = select([sconn],[],[])  # wait for data
         data = sconn.read(sconn.inWaiting()) # blocking
         return data
+    ser_read = msp_ctrl.buffered_reader(ser_read)
 
     servers = {}
     for p in ports: